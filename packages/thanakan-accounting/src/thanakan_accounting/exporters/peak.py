@@ -13,9 +13,23 @@ import openpyxl
 
 from thanakan_statement import Account, Transaction
 
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 # Peak Import Statement template format
 SHEET_NAME = "Import_BankStatement"
 HEADERS = ("วันที่รายการ *", "จำนวนเงิน *", "หมายเหตุ")
+COLUMN_WIDTHS = (12, 15, 80)
+
+# Excel writer engines; xlsxwriter is faster but an optional extra
+# (pip install thanakan-accounting[xlsxwriter]) and only used on request
+ENGINES = ("openpyxl", "xlsxwriter")
+
+# Flush each row to disk as it is written instead of keeping the whole
+# sheet in memory
+XLSXWRITER_OPTIONS = {"constant_memory": True}
 
 
 def _format_date(txn: Transaction) -> str:
@@ -55,27 +69,56 @@ def _format_note(txn: Transaction, max_length: int = 1000) -> str:
 
 
 def _write_transactions(
-    ws: openpyxl.worksheet.worksheet.Worksheet,
+    ws: openpyxl.worksheet._write_only.WriteOnlyWorksheet,
     transactions: list[Transaction],
 ) -> None:
-    """Write transactions to worksheet with header row."""
-    # Write header at row 1
-    for col, header in enumerate(HEADERS, 1):
-        ws.cell(row=1, column=col, value=header)
+    """Write transactions to a write-only worksheet with header row.
+
+    Rows are streamed to disk as they are appended, so memory stays flat
+    for large accounts.
+    """
+    # Column widths must be set before the first row is written
+    for letter, width in zip("ABC", COLUMN_WIDTHS):
+        ws.column_dimensions[letter].width = width
+
+    ws.append(HEADERS)
+    for txn in transactions:
+        ws.append((_format_date(txn), _format_amount(txn), _format_note(txn)))
+
+
+def _write_transactions_xlsxwriter(ws, transactions: list[Transaction]) -> None:
+    """Write transactions to an xlsxwriter worksheet with header row.
+
+    Rows are written strictly in order, as constant_memory mode requires.
+    """
+    ws.write_row(0, 0, HEADERS)
+
+    # Data starts at row 2 (index 1)
+    for row_num, txn in enumerate(transactions, 1):
+        ws.write_string(row_num, 0, _format_date(txn))
+        ws.write_number(row_num, 1, _format_amount(txn))
+        ws.write_string(row_num, 2, _format_note(txn))
+
+    for col, width in enumerate(COLUMN_WIDTHS):
+        ws.set_column(col, col, width)
 
-    # Data starts at row 2
-    for row_num, txn in enumerate(transactions, 2):
-        ws.cell(row=row_num, column=1, value=_format_date(txn))
-        ws.cell(row=row_num, column=2, value=_format_amount(txn))
-        ws.cell(row=row_num, column=3, value=_format_note(txn))
 
-    # Adjust column widths
-    ws.column_dimensions["A"].width = 12
-    ws.column_dimensions["B"].width = 15
-    ws.column_dimensions["C"].width = 80
+def _resolve_engine(engine: str) -> str:
+    """Map an engine name to the writer actually used."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+    if engine == "xlsxwriter" and xlsxwriter is None:
+        raise ImportError(
+            "xlsxwriter is not installed (pip install thanakan-accounting[xlsxwriter])"
+        )
+    return engine
 
 
-def export_to_peak(accounts: list[Account], output_path: Path | str) -> None:
+def export_to_peak(
+    accounts: list[Account],
+    output_path: Path | str,
+    engine: str = "openpyxl",
+) -> None:
     """Export multiple accounts to Peak Import Statement Excel format.
 
     Each account is exported to a separate sheet.
@@ -83,10 +126,20 @@ def export_to_peak(accounts: list[Account], output_path: Path | str) -> None:
     Args:
         accounts: List of Account objects with consolidated transactions
         output_path: Path to output Excel file
+        engine: Excel writer: "openpyxl" (default) or "xlsxwriter"
     """
     output_path = Path(output_path)
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+
+    if _resolve_engine(engine) == "xlsxwriter":
+        with xlsxwriter.Workbook(str(output_path), XLSXWRITER_OPTIONS) as wb:
+            for account in accounts:
+                sheet_name = account.account_number.replace("-", "")[:31]
+                _write_transactions_xlsxwriter(
+                    wb.add_worksheet(sheet_name), account.all_transactions
+                )
+        return
+
+    wb = openpyxl.Workbook(write_only=True)
 
     for account in accounts:
         sheet_name = account.account_number.replace("-", "")[:31]
@@ -96,17 +149,29 @@ def export_to_peak(accounts: list[Account], output_path: Path | str) -> None:
     wb.save(output_path)
 
 
-def export_single_to_peak(account: Account, output_path: Path | str) -> None:
+def export_single_to_peak(
+    account: Account,
+    output_path: Path | str,
+    engine: str = "openpyxl",
+) -> None:
     """Export a single account to Peak Import Statement format.
 
     Args:
         account: Account object with consolidated transactions
         output_path: Path to output Excel file
+        engine: Excel writer: "openpyxl" (default) or "xlsxwriter"
     """
     output_path = Path(output_path)
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = SHEET_NAME
+
+    if _resolve_engine(engine) == "xlsxwriter":
+        with xlsxwriter.Workbook(str(output_path), XLSXWRITER_OPTIONS) as wb:
+            _write_transactions_xlsxwriter(
+                wb.add_worksheet(SHEET_NAME), account.all_transactions
+            )
+        return
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_NAME)
 
     _write_transactions(ws, account.all_transactions)
     wb.save(output_path)
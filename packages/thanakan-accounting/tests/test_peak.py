@@ -2,6 +2,7 @@
 
 import datetime as dt
 from decimal import Decimal
+from unittest.mock import patch
 
 import openpyxl
 import pytest
@@ -302,3 +303,61 @@ class TestExportToPeak:
             header = (ws.cell(1, 1).value, ws.cell(1, 2).value, ws.cell(1, 3).value)
             assert header == HEADERS
         wb.close()
+
+
+class TestEngines:
+    """Tests for the openpyxl/xlsxwriter engine choice."""
+
+    @staticmethod
+    def _read_rows(path):
+        wb = openpyxl.load_workbook(path)
+        rows = {
+            ws.title: [list(row) for row in ws.iter_rows(values_only=True)]
+            for ws in wb
+        }
+        wb.close()
+        return rows
+
+    def test_xlsxwriter_matches_openpyxl_single(self, sample_account, tmp_path):
+        """Both engines should write the same cells for one account."""
+        pytest.importorskip("xlsxwriter")
+        openpyxl_out = tmp_path / "openpyxl.xlsx"
+        xlsxwriter_out = tmp_path / "xlsxwriter.xlsx"
+        export_single_to_peak(sample_account, openpyxl_out, engine="openpyxl")
+        export_single_to_peak(sample_account, xlsxwriter_out, engine="xlsxwriter")
+
+        assert self._read_rows(xlsxwriter_out) == self._read_rows(openpyxl_out)
+
+    def test_xlsxwriter_matches_openpyxl_multi(
+        self, sample_transaction, sample_deposit_transaction, tmp_path
+    ):
+        """Both engines should write the same sheets for several accounts."""
+        pytest.importorskip("xlsxwriter")
+        accounts = [
+            Account(account_number="111-1-11111-1", all_transactions=[sample_transaction]),
+            Account(
+                account_number="222-2-22222-2",
+                all_transactions=[sample_deposit_transaction],
+            ),
+        ]
+        openpyxl_out = tmp_path / "openpyxl.xlsx"
+        xlsxwriter_out = tmp_path / "xlsxwriter.xlsx"
+        export_to_peak(accounts, openpyxl_out, engine="openpyxl")
+        export_to_peak(accounts, xlsxwriter_out, engine="xlsxwriter")
+
+        assert self._read_rows(xlsxwriter_out) == self._read_rows(openpyxl_out)
+
+    def test_openpyxl_by_default(self, sample_account, tmp_path):
+        """xlsxwriter should only be used when asked for, even if installed."""
+        with patch("thanakan_accounting.exporters.peak.xlsxwriter") as xlsxwriter:
+            export_single_to_peak(sample_account, tmp_path / "out.xlsx")
+
+        xlsxwriter.Workbook.assert_not_called()
+        assert self._read_rows(tmp_path / "out.xlsx")[SHEET_NAME][0] == list(HEADERS)
+
+    def test_unknown_engine(self, sample_account, tmp_path):
+        """Unknown engine names should be rejected."""
+        with pytest.raises(ValueError):
+            export_single_to_peak(sample_account, tmp_path / "out.xlsx", engine="csv")
+        with pytest.raises(ValueError):
+            export_single_to_peak(sample_account, tmp_path / "out.xlsx", engine="auto")
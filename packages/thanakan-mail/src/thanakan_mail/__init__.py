@@ -1,5 +1,7 @@
 """Download Thai bank PDF statements from email."""
 
+import importlib
+
 from .models import (
     EmailAttachment,
     EmailMessage,
@@ -13,24 +15,12 @@ from .bank_config import (
     SCB_CONFIG,
     BANK_CONFIGS,
 )
-from .provider import (
-    EmailProvider,
-    GmailProvider,
-)
 from .downloader import (
     StatementDownloader,
     download_bank_statements,
     results_to_metadata,
     save_metadata,
 )
-from .unlock import (
-    unlock_pdf,
-    unlock_pdfs,
-    is_pdf_encrypted,
-    get_saved_password,
-    save_password,
-    clear_saved_password,
-)
 from .kshop import (
     KShopSummary,
     KShopFetcher,
@@ -41,6 +31,35 @@ from .kshop import (
     KSHOP_SENDER,
 )
 
+# Imported on first access: the Gmail client stack (googleapiclient,
+# google-auth, httplib2) and pikepdf are slow to import, and commands
+# like `thanakan mail logout` never touch them
+_LAZY_EXPORTS = {
+    "EmailProvider": ".provider",
+    "GmailProvider": ".provider",
+    "unlock_pdf": ".unlock",
+    "unlock_pdf_bytes": ".unlock",
+    "unlock_pdfs": ".unlock",
+    "is_pdf_encrypted": ".unlock",
+    "get_saved_password": ".unlock",
+    "save_password": ".unlock",
+    "clear_saved_password": ".unlock",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
+
 __all__ = [
     "EmailAttachment",
     "EmailMessage",
@@ -58,6 +77,7 @@ __all__ = [
     "results_to_metadata",
     "save_metadata",
     "unlock_pdf",
+    "unlock_pdf_bytes",
     "unlock_pdfs",
     "is_pdf_encrypted",
     "get_saved_password",
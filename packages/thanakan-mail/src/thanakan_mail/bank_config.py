@@ -5,6 +5,27 @@ from dataclasses import dataclass
 from .models import EmailAttachment
 
 
+def gmail_date_filter(since: str | None = None, until: str | None = None) -> str:
+    """Build the date part of a Gmail search query.
+
+    Gmail resolves the durations itself, so the filter does not depend on
+    today's date.
+
+    Args:
+        since: Emails newer than this duration (e.g., "30d", "2w", "3m", "1y")
+        until: Emails older than this duration (e.g., "7d", "1w")
+
+    Returns:
+        Query terms with a leading space, or "" for no date filter
+    """
+    query = ""
+    if since:
+        query += f" newer_than:{since}"
+    if until:
+        query += f" older_than:{until}"
+    return query
+
+
 @dataclass(frozen=True)
 class BankEmailConfig:
     """Configuration for a specific bank's emails."""
@@ -34,11 +55,7 @@ class BankEmailConfig:
         query = f"from:{self.sender_email} has:attachment"
         if self.subject_filter:
             query += f" subject:{self.subject_filter}"
-        if since is not None:
-            query += f" newer_than:{since}"
-        if until is not None:
-            query += f" older_than:{until}"
-        return query
+        return query + gmail_date_filter(since, until)
 
     def matches_filename(self, filename: str) -> bool:
         """Check if filename matches bank's statement patterns."""
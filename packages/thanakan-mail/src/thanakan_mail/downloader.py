@@ -2,39 +2,53 @@
 
 from __future__ import annotations
 
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from pydantic import TypeAdapter
+
 from .bank_config import BankEmailConfig, BANK_CONFIGS, is_statement_pdf
-from .models import DownloadResult, EmailMetadata
+from .models import DownloadResult, EmailMessage, EmailMetadata
 
 if TYPE_CHECKING:
     from .provider import EmailProvider
 
+# Concurrent attachment downloads per bank
+DOWNLOAD_WORKERS = 8
+
+_METADATA_ADAPTER = TypeAdapter(list[EmailMetadata])
+
 
 class StatementDownloader:
     """Downloads bank statement PDFs from email.
 
     Orchestrates: email provider + bank config + filtering.
+
+    Attachments are downloaded from worker threads, so the provider's
+    download_attachment must be thread-safe.
     """
 
     def __init__(
         self,
         provider: EmailProvider,
         bank_config: BankEmailConfig,
-        download_dir: Path | str,
+        download_dir: Path | str | None = None,
+        download_workers: int = DOWNLOAD_WORKERS,
     ):
         """Initialize downloader.
 
         Args:
             provider: Email provider implementation (GmailProvider, etc.)
             bank_config: Bank-specific configuration
-            download_dir: Directory to save downloaded PDFs
+            download_dir: Directory to save downloaded PDFs (not needed
+                for fetch_statements)
+            download_workers: Maximum concurrent attachment downloads
         """
         self.provider = provider
         self.bank_config = bank_config
-        self.download_dir = Path(download_dir)
+        self.download_dir = Path(download_dir) if download_dir is not None else None
+        self.download_workers = download_workers
 
     def download_statements(
         self,
@@ -54,8 +68,38 @@ class StatementDownloader:
         Returns:
             List of download results (one per email)
         """
+        if self.download_dir is None:
+            raise ValueError("download_dir is required to save statements")
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
+        return self._collect(max_emails, since, until, verbose, save=True)
+
+    def fetch_statements(
+        self,
+        max_emails: int = 100,
+        since: str | None = None,
+        until: str | None = None,
+        verbose: bool = False,
+    ) -> list[DownloadResult]:
+        """Fetch all statement PDFs for this bank into memory.
+
+        Same as download_statements, but nothing is written to disk: each
+        result's pdf_data maps the filename to the PDF bytes.
+
+        Returns:
+            List of download results (one per email)
+        """
+        return self._collect(max_emails, since, until, verbose, save=False)
+
+    def _collect(
+        self,
+        max_emails: int,
+        since: str | None,
+        until: str | None,
+        verbose: bool,
+        save: bool,
+    ) -> list[DownloadResult]:
+        """Search, fetch and process statement emails for this bank."""
         # Search for emails
         if verbose:
             print(f"Searching for {self.bank_config.bank_code.upper()} emails...")
@@ -66,15 +110,30 @@ class StatementDownloader:
         if verbose:
             print(f"Found {len(messages)} emails")
 
-        # Process each email
+        # Fetch all message details up front (batched when supported)
+        details = self._fetch_details([m.message_id for m in messages])
+
+        # Start all statement downloads, then process emails in order
         results: list[DownloadResult] = []
 
-        for i, msg_preview in enumerate(messages, 1):
-            if verbose:
-                print(f"\n[{i}/{len(messages)}] Processing {msg_preview.message_id}...")
+        with ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+            downloads = {
+                (message.message_id, attachment.attachment_id): pool.submit(
+                    self.provider.download_attachment,
+                    message.message_id,
+                    attachment.attachment_id,
+                )
+                for message in details
+                for attachment in message.attachments
+                if is_statement_pdf(attachment, self.bank_config)
+            }
+
+            for i, message in enumerate(details, 1):
+                if verbose:
+                    print(f"\n[{i}/{len(details)}] Processing {message.message_id}...")
 
-            result = self._process_message(msg_preview.message_id, verbose=verbose)
-            results.append(result)
+                result = self._process_message(message, downloads, verbose=verbose, save=save)
+                results.append(result)
 
         if verbose:
             total_pdfs = sum(len(r.downloaded_files) for r in results)
@@ -82,10 +141,35 @@ class StatementDownloader:
 
         return results
 
-    def _process_message(self, message_id: str, verbose: bool = False) -> DownloadResult:
-        """Process a single email message."""
-        # Get full message details
-        message = self.provider.get_message_details(message_id)
+    def _fetch_details(self, message_ids: list[str]) -> list[EmailMessage]:
+        """Fetch full message details, in one batch call per chunk if possible.
+
+        Providers that don't implement get_messages_details are queried
+        one message at a time.
+        """
+        get_many = getattr(self.provider, "get_messages_details", None)
+        if get_many is not None:
+            return get_many(message_ids)
+        return [self.provider.get_message_details(mid) for mid in message_ids]
+
+    def _process_message(
+        self,
+        message: EmailMessage,
+        downloads: dict[tuple[str, str], Future[bytes]],
+        verbose: bool = False,
+        save: bool = True,
+    ) -> DownloadResult:
+        """Process a single email message.
+
+        Args:
+            message: Full message details
+            downloads: Pending attachment downloads keyed by
+                (message_id, attachment_id)
+            verbose: Print progress messages
+            save: Write PDFs to download_dir, otherwise keep them in
+                the result's pdf_data
+        """
+        message_id = message.message_id
 
         if verbose:
             print(f"  Subject: {message.subject}")
@@ -102,26 +186,27 @@ class StatementDownloader:
                 continue
 
             try:
-                # Download attachment
-                data = self.provider.download_attachment(
-                    message_id,
-                    attachment.attachment_id,
-                )
+                # Wait for attachment download
+                data = downloads[(message_id, attachment.attachment_id)].result()
 
-                # Save to file (prefix with message_id to avoid collisions)
+                # Prefix with message_id to avoid collisions
                 filename = f"{message_id}_{attachment.filename}"
-                file_path = self.download_dir / filename
 
-                # Warn if file exists (will be overwritten)
-                if file_path.exists() and verbose:
-                    print(f"  Overwriting: {filename}")
+                if save:
+                    file_path = self.download_dir / filename
 
-                file_path.write_bytes(data)
+                    # Warn if file exists (will be overwritten)
+                    if file_path.exists() and verbose:
+                        print(f"  Overwriting: {filename}")
+
+                    file_path.write_bytes(data)
+                else:
+                    result.pdf_data[filename] = data
 
                 # Store relative filename for portability
                 result.downloaded_files.append(filename)
                 if verbose:
-                    print(f"  Saved: {filename}")
+                    print(f"  {'Saved' if save else 'Fetched'}: {filename}")
 
             except Exception as e:
                 error_msg = f"Failed to download {attachment.filename}: {e}"
@@ -188,10 +273,4 @@ def save_metadata(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(
-            [m.model_dump() for m in metadata],
-            f,
-            indent=2,
-            default=str,
-        )
+    output_path.write_bytes(_METADATA_ADAPTER.dump_json(metadata, indent=2))
@@ -6,14 +6,14 @@ store transaction data: store name, store ID, daily amount, and account number.
 
 from __future__ import annotations
 
-import json
 import re
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from .bank_config import gmail_date_filter
 from .models import EmailMessage
 
 if TYPE_CHECKING:
@@ -34,6 +34,9 @@ class KShopSummary(BaseModel):
     account_name: str = ""
 
 
+_SUMMARIES_ADAPTER = TypeAdapter(list[KShopSummary])
+
+
 class KShopParseError(Exception):
     """Raised when a KShop email cannot be parsed."""
 
@@ -135,11 +138,7 @@ class KShopFetcher:
         Returns:
             List of parsed KShop daily summaries.
         """
-        query = f"from:{KSHOP_SENDER}"
-        if since:
-            query += f" newer_than:{since}"
-        if until:
-            query += f" older_than:{until}"
+        query = f"from:{KSHOP_SENDER}" + gmail_date_filter(since, until)
 
         if verbose:
             print("Searching for KShop emails...")
@@ -213,6 +212,4 @@ def save_kshop_json(
     """Save KShop summaries as JSON."""
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    data = [s.model_dump(mode="json") for s in summaries]
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    output_path.write_bytes(_SUMMARIES_ADAPTER.dump_json(summaries, indent=2))
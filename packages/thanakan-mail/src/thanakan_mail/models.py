@@ -32,6 +32,8 @@ class DownloadResult(BaseModel):
     downloaded_files: list[str] = Field(default_factory=list)
     skipped_attachments: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
+    # PDF bytes by filename, only filled by StatementDownloader.fetch_statements
+    pdf_data: dict[str, bytes] = Field(default_factory=dict, exclude=True)
 
 
 class EmailMetadata(BaseModel):
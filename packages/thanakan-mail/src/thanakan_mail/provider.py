@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import binascii
 import os
+import threading
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
@@ -18,6 +19,14 @@ from .models import EmailAttachment, EmailMessage
 # Gmail API scope - read only
 GMAIL_SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 
+# Requests per Gmail batch call (Gmail accepts 100 but rate-limits
+# batches larger than 50)
+GMAIL_BATCH_SIZE = 50
+
+# Retries (with exponential backoff) for a single message lookup, e.g.
+# after a batch sub-request hit Gmail's per-user rate limit
+GMAIL_NUM_RETRIES = 3
+
 
 @runtime_checkable
 class EmailProvider(Protocol):
@@ -49,8 +58,9 @@ class GmailProvider:
 
     Implements the EmailProvider protocol.
 
-    Note: This class is not thread-safe. For concurrent use, create
-    separate instances per thread.
+    Safe to share between threads: credentials are shared, but each
+    thread gets its own Gmail service object (the underlying httplib2
+    connection is not thread-safe).
     """
 
     def __init__(
@@ -90,14 +100,23 @@ class GmailProvider:
 
         self.client_secret_path = client_secret_path
         self.token_path = token_path
-        self._service: Resource | None = None
+        self._credentials: Credentials | None = None
+        self._local = threading.local()
+        self._auth_lock = threading.Lock()
 
     @property
     def service(self) -> Resource:
-        """Get authenticated Gmail service (lazy initialization)."""
-        if self._service is None:
-            self.authenticate()
-        return self._service
+        """Get authenticated Gmail service for this thread (lazy initialization)."""
+        service = getattr(self._local, "service", None)
+        if service is None:
+            with self._auth_lock:
+                if self._credentials is None:
+                    self.authenticate()
+            service = getattr(self._local, "service", None)
+            if service is None:
+                service = build("gmail", "v1", credentials=self._credentials)
+                self._local.service = service
+        return service
 
     def authenticate(self) -> None:
         """Authenticate with Gmail using OAuth 2.0."""
@@ -139,7 +158,8 @@ class GmailProvider:
             except OSError as e:
                 raise OSError(f"Failed to save OAuth token to {self.token_path}: {e}") from e
 
-        self._service = build("gmail", "v1", credentials=creds)
+        self._credentials = creds
+        self._local.service = build("gmail", "v1", credentials=creds)
 
     def search_messages(self, query: str, max_results: int = 100) -> list[EmailMessage]:
         """Search for messages using Gmail query syntax."""
@@ -181,9 +201,48 @@ class GmailProvider:
             self.service.users()
             .messages()
             .get(userId="me", id=message_id, format="full")
-            .execute()
+            .execute(num_retries=GMAIL_NUM_RETRIES)
         )
+        return self._message_from_response(message_id, msg)
+
+    def get_messages_details(self, message_ids: list[str]) -> list[EmailMessage]:
+        """Fetch full details for several messages using batch requests.
+
+        Sends up to GMAIL_BATCH_SIZE message lookups per HTTP call instead
+        of one call per message. Lookups that fail inside a batch (often
+        429 rateLimitExceeded) are retried one at a time through
+        get_message_details, which backs off between attempts.
+
+        Returns:
+            Messages in the same order as message_ids
+        """
+        responses: dict[str, dict] = {}
+
+        def callback(request_id: str, response: dict, exception: Exception | None) -> None:
+            # Failed lookups are left out and retried below
+            if exception is None:
+                responses[request_id] = response
+
+        messages_api = self.service.users().messages()
+        for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for i in range(start, min(start + GMAIL_BATCH_SIZE, len(message_ids))):
+                batch.add(
+                    messages_api.get(userId="me", id=message_ids[i], format="full"),
+                    request_id=str(i),
+                )
+            batch.execute()
+
+        # Retry failed lookups individually; one that still fails raises
+        return [
+            self._message_from_response(message_id, responses[str(i)])
+            if str(i) in responses
+            else self.get_message_details(message_id)
+            for i, message_id in enumerate(message_ids)
+        ]
 
+    def _message_from_response(self, message_id: str, msg: dict) -> EmailMessage:
+        """Build an EmailMessage from a messages.get response."""
         # Extract headers
         headers = msg.get("payload", {}).get("headers", [])
         subject = self._get_header(headers, "Subject")
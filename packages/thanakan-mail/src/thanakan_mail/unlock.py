@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import io
+import mmap
+import re
 from pathlib import Path
 from typing import Callable
 
@@ -13,6 +16,12 @@ PASSWORD_FILE = CONFIG_DIR / "pdf_password.txt"
 KEYRING_SERVICE = "thanakan-pdf"
 KEYRING_USERNAME = "pdf-password"
 
+# The /Encrypt name, including forms with #xx escapes (e.g. /Encr#79pt),
+# which PDF readers treat as the same key
+_ENCRYPT_NAME_RE = re.compile(
+    rb"/(?:E|#45)(?:n|#6[eE])(?:c|#63)(?:r|#72)(?:y|#79)(?:p|#70)(?:t|#74)"
+)
+
 
 def get_saved_password() -> str | None:
     """Get saved password from keyring or plaintext file.
@@ -127,6 +136,31 @@ def unlock_pdf(
     return output_path
 
 
+def unlock_pdf_bytes(pdf_bytes: bytes, password: str) -> bytes:
+    """Unlock a password-protected PDF held in memory.
+
+    Args:
+        pdf_bytes: Encrypted PDF content
+        password: PDF password (required)
+
+    Returns:
+        The unlocked PDF content
+
+    Raises:
+        pikepdf.PasswordError: If password is incorrect
+        ValueError: If password is not provided
+    """
+    if not password:
+        raise ValueError("Password is required")
+
+    output = io.BytesIO()
+    with pikepdf.open(io.BytesIO(pdf_bytes), password=password) as pdf:
+        # Save without encryption
+        pdf.save(output)
+
+    return output.getvalue()
+
+
 def unlock_pdfs(
     pdf_paths: list[Path],
     output_dir: Path | None = None,
@@ -174,15 +208,38 @@ def unlock_pdfs(
     return successful, failed
 
 
+def _may_be_encrypted(pdf_path: Path | str) -> bool:
+    """Cheap pre-check: does the file contain an /Encrypt key at all?
+
+    Encryption is declared by /Encrypt in a trailer or cross-reference
+    stream dictionary, which is never compressed, so a file with no
+    /Encrypt name anywhere, plain or #xx-escaped, cannot be encrypted.
+    A hit may still be a false positive (e.g. an earlier revision), so
+    it needs confirming.
+    """
+    try:
+        with open(pdf_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _ENCRYPT_NAME_RE.search(data) is not None
+    except (OSError, ValueError):
+        # Unreadable or empty file: let pikepdf decide
+        return True
+
+
 def is_pdf_encrypted(pdf_path: Path | str) -> bool:
     """Check if a PDF is password-protected.
 
+    Files without an /Encrypt key are rejected with a memory-mapped byte
+    scan; only the rest are opened with pikepdf.
+
     Args:
         pdf_path: Path to PDF file
 
     Returns:
         True if PDF is encrypted, False otherwise
     """
+    if not _may_be_encrypted(pdf_path):
+        return False
+
     try:
         with pikepdf.open(pdf_path) as _:
             return False
@@ -263,6 +263,41 @@ class TestUnlockCommand:
         output = result.stdout + (result.stderr or "")
         assert "No PDF files found" in output
 
+    def test_unlock_matches_extension_case_insensitively(self, temp_pdf_dir):
+        """Should find .PDF and .Pdf files, skipping non-PDF files."""
+        (temp_pdf_dir / "statement.pdf").rename(temp_pdf_dir / "upper.PDF")
+        (temp_pdf_dir / "notes.txt").write_text("not a pdf")
+        (temp_pdf_dir / "folder.pdf").mkdir()
+
+        result = runner.invoke(
+            app,
+            ["mail", "unlock", str(temp_pdf_dir), "--password", "testpass", "-r", "none"],
+        )
+
+        assert result.exit_code == 0
+        assert "Found 1 encrypted PDF(s)" in result.stdout
+        assert "Unlocked 1 PDF(s)" in result.stdout
+
+    def test_unlock_reports_each_file_of_a_batch(self, temp_pdf_dir):
+        """Should unlock several PDFs and report failures per file."""
+        import pikepdf
+
+        for name, user_password in [("b.pdf", "testpass"), ("c.pdf", "testpass"), ("d.pdf", "other")]:
+            pdf = pikepdf.Pdf.new()
+            pdf.add_blank_page(page_size=(612, 792))
+            pdf.save(temp_pdf_dir / name, encryption=pikepdf.Encryption(owner="o", user=user_password))
+
+        result = runner.invoke(
+            app,
+            ["mail", "unlock", str(temp_pdf_dir), "--password", "testpass", "-r", "none", "-v"],
+        )
+
+        assert result.exit_code == 1
+        assert "Unlocked 3 PDF(s)" in result.stdout
+        assert result.stdout.index("b_unlocked.pdf") < result.stdout.index("c_unlocked.pdf")
+        output = result.stdout + (result.stderr or "")
+        assert "d.pdf: Incorrect password" in output
+
     def test_unlock_verbose_shows_details(self, temp_pdf_dir):
         """Should show details in verbose mode."""
         result = runner.invoke(
@@ -0,0 +1,327 @@
+"""Tests for the statement downloader and Gmail provider."""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from thanakan_mail.bank_config import BANK_CONFIGS, gmail_date_filter
+from thanakan_mail.downloader import StatementDownloader, save_metadata
+from thanakan_mail.models import DownloadResult, EmailAttachment, EmailMessage
+from thanakan_mail.provider import GMAIL_BATCH_SIZE, GMAIL_NUM_RETRIES, GmailProvider
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class FakeRequest:
+    """Stand-in for a messages.get HttpRequest."""
+
+    def __init__(self, message_id: str, responses: dict, failing_retry: set[str]):
+        self.message_id = message_id
+        self._responses = responses
+        self._failing_retry = failing_retry
+        self.num_retries: int | None = None
+
+    def execute(self, num_retries: int = 0) -> dict:
+        self.num_retries = num_retries
+        if self.message_id in self._failing_retry:
+            raise RuntimeError(f"retry boom {self.message_id}")
+        return self._responses[self.message_id]
+
+
+class FakeBatch:
+    """Stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, responses: dict, failing: set[str]):
+        self._callback = callback
+        self._responses = responses
+        self._failing = failing
+        self._requests: list[tuple[str, FakeRequest]] = []
+
+    def add(self, request, request_id: str) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self._requests:
+            message_id = request.message_id
+            if message_id in self._failing:
+                self._callback(request_id, None, RuntimeError(f"boom {message_id}"))
+            else:
+                self._callback(request_id, self._responses[message_id], None)
+
+
+def _make_service(
+    message_ids: list[str],
+    failing: set[str] | None = None,
+    failing_retry: set[str] | None = None,
+):
+    """Fake Gmail service.
+
+    Lookups in failing error inside a batch; those in failing_retry also
+    error when fetched on their own.
+    """
+    responses = {
+        mid: {
+            "threadId": f"thread-{mid}",
+            "payload": {"headers": [{"name": "Subject", "value": f"Subject {mid}"}]},
+        }
+        for mid in message_ids
+    }
+    batches: list[FakeBatch] = []
+    requests: list[FakeRequest] = []
+
+    def new_batch_http_request(callback):
+        batch = FakeBatch(callback, responses, failing or set())
+        batches.append(batch)
+        return batch
+
+    def get(userId, id, format):
+        request = FakeRequest(id, responses, failing_retry or set())
+        requests.append(request)
+        return request
+
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = new_batch_http_request
+    service.users.return_value.messages.return_value.get.side_effect = get
+    service.requests = requests
+    return service, batches
+
+
+@pytest.fixture
+def provider(tmp_path):
+    return GmailProvider(
+        client_secret_path=tmp_path / "client_secret.json",
+        token_path=tmp_path / "token.json",
+    )
+
+
+# =============================================================================
+# GmailProvider.get_messages_details
+# =============================================================================
+
+
+class TestGetMessagesDetails:
+    """Tests for batched message detail lookups."""
+
+    def test_returns_messages_in_request_order(self, provider):
+        message_ids = [f"m{i}" for i in range(5)]
+        service, batches = _make_service(message_ids)
+        provider._local.service = service
+
+        messages = provider.get_messages_details(message_ids)
+
+        assert [m.message_id for m in messages] == message_ids
+        assert messages[2].subject == "Subject m2"
+        assert messages[2].thread_id == "thread-m2"
+        assert len(batches) == 1
+
+    def test_splits_into_batches(self, provider):
+        message_ids = [f"m{i}" for i in range(GMAIL_BATCH_SIZE * 2 + 1)]
+        service, batches = _make_service(message_ids)
+        provider._local.service = service
+
+        messages = provider.get_messages_details(message_ids)
+
+        assert len(messages) == len(message_ids)
+        assert [len(b._requests) for b in batches] == [GMAIL_BATCH_SIZE, GMAIL_BATCH_SIZE, 1]
+
+    def test_retries_failed_lookup_individually(self, provider):
+        """A sub-request failing in the batch (e.g. 429) should not fail the rest."""
+        message_ids = ["m0", "m1", "m2"]
+        service, batches = _make_service(message_ids, failing={"m1"})
+        provider._local.service = service
+
+        messages = provider.get_messages_details(message_ids)
+
+        assert [m.message_id for m in messages] == message_ids
+        assert messages[1].subject == "Subject m1"
+        assert len(batches) == 1
+        # Three batched lookups plus one retry with backoff
+        retried = service.requests[3:]
+        assert [r.message_id for r in retried] == ["m1"]
+        assert retried[0].num_retries == GMAIL_NUM_RETRIES
+
+    def test_raises_when_retry_fails(self, provider):
+        message_ids = ["m0", "m1", "m2"]
+        service, _ = _make_service(
+            message_ids, failing={"m1", "m2"}, failing_retry={"m1", "m2"}
+        )
+        provider._local.service = service
+
+        with pytest.raises(RuntimeError, match="retry boom m1"):
+            provider.get_messages_details(message_ids)
+
+    def test_empty_ids(self, provider):
+        service, batches = _make_service([])
+        provider._local.service = service
+
+        assert provider.get_messages_details([]) == []
+        assert batches == []
+
+
+class TestServicePerThread:
+    """Tests for sharing one provider between threads."""
+
+    def test_each_thread_gets_own_service(self, provider, monkeypatch):
+        monkeypatch.setattr(
+            "thanakan_mail.provider.build", lambda *args, **kwargs: object()
+        )
+        provider._credentials = object()
+
+        services = []
+        thread = threading.Thread(target=lambda: services.append(provider.service))
+        thread.start()
+        thread.join()
+
+        assert provider.service is provider.service
+        assert services[0] is not provider.service
+
+
+# =============================================================================
+# StatementDownloader
+# =============================================================================
+
+
+def _make_message(message_id: str) -> EmailMessage:
+    return EmailMessage(
+        message_id=message_id,
+        subject="statement",
+        attachments=[
+            EmailAttachment(
+                attachment_id=f"att-{message_id}",
+                filename="STM_123.pdf",
+                mime_type="application/pdf",
+            )
+        ],
+    )
+
+
+class TestDownloaderFetch:
+    """Tests for how the downloader fetches message details."""
+
+    def test_uses_batch_lookup_when_available(self, tmp_path):
+        provider = MagicMock()
+        provider.search_messages.return_value = [
+            EmailMessage(message_id="a"),
+            EmailMessage(message_id="b"),
+        ]
+        provider.get_messages_details.return_value = [_make_message("a"), _make_message("b")]
+        provider.download_attachment.return_value = b"%PDF-1.4"
+
+        downloader = StatementDownloader(provider, BANK_CONFIGS["kbank"], tmp_path)
+        results = downloader.download_statements()
+
+        provider.get_messages_details.assert_called_once_with(["a", "b"])
+        provider.get_message_details.assert_not_called()
+        assert [r.downloaded_files for r in results] == [
+            ["a_STM_123.pdf"],
+            ["b_STM_123.pdf"],
+        ]
+
+    def test_falls_back_to_single_lookups(self, tmp_path):
+        provider = MagicMock(
+            spec=["search_messages", "get_message_details", "download_attachment"]
+        )
+        provider.search_messages.return_value = [
+            EmailMessage(message_id="a"),
+            EmailMessage(message_id="b"),
+        ]
+        provider.get_message_details.side_effect = _make_message
+        provider.download_attachment.return_value = b"%PDF-1.4"
+
+        downloader = StatementDownloader(provider, BANK_CONFIGS["kbank"], tmp_path)
+        results = downloader.download_statements()
+
+        assert provider.get_message_details.call_count == 2
+        assert [r.message.message_id for r in results] == ["a", "b"]
+        assert (tmp_path / "b_STM_123.pdf").read_bytes() == b"%PDF-1.4"
+
+    def test_download_error_is_recorded(self, tmp_path):
+        provider = MagicMock()
+        provider.search_messages.return_value = [
+            EmailMessage(message_id="a"),
+            EmailMessage(message_id="b"),
+        ]
+        provider.get_messages_details.return_value = [_make_message("a"), _make_message("b")]
+
+        def download_attachment(message_id, attachment_id):
+            if message_id == "a":
+                raise ValueError("no data")
+            return b"%PDF-1.4"
+
+        provider.download_attachment.side_effect = download_attachment
+
+        downloader = StatementDownloader(provider, BANK_CONFIGS["kbank"], tmp_path)
+        results = downloader.download_statements()
+
+        assert results[0].downloaded_files == []
+        assert results[0].errors == ["Failed to download STM_123.pdf: no data"]
+        assert results[1].downloaded_files == ["b_STM_123.pdf"]
+
+    def test_fetch_keeps_pdfs_in_memory(self, tmp_path):
+        provider = MagicMock()
+        provider.search_messages.return_value = [EmailMessage(message_id="a")]
+        provider.get_messages_details.return_value = [_make_message("a")]
+        provider.download_attachment.return_value = b"%PDF-1.4"
+
+        downloader = StatementDownloader(provider, BANK_CONFIGS["kbank"])
+        results = downloader.fetch_statements()
+
+        assert results[0].downloaded_files == ["a_STM_123.pdf"]
+        assert results[0].pdf_data == {"a_STM_123.pdf": b"%PDF-1.4"}
+        assert "pdf_data" not in results[0].model_dump()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_requires_download_dir(self):
+        downloader = StatementDownloader(MagicMock(), BANK_CONFIGS["kbank"])
+
+        with pytest.raises(ValueError, match="download_dir"):
+            downloader.download_statements()
+
+
+class TestSaveMetadata:
+    """Tests for the metadata JSON file."""
+
+    def test_writes_metadata(self, tmp_path):
+        message = EmailMessage(
+            message_id="m1", thread_id="t1", subject="สเตทเมนต์", date="2025-01-01"
+        )
+        result = DownloadResult(message=message, downloaded_files=["/tmp/a.pdf"])
+        output = tmp_path / "metadata.json"
+
+        save_metadata([result], output)
+
+        assert json.loads(output.read_text(encoding="utf-8")) == [
+            {
+                "email_id": "m1",
+                "thread_id": "t1",
+                "date": "2025-01-01",
+                "subject": "สเตทเมนต์",
+                "pdf_filenames": ["/tmp/a.pdf"],
+            }
+        ]
+
+
+# =============================================================================
+# Gmail queries
+# =============================================================================
+
+
+class TestGmailQuery:
+    """Tests for Gmail search query building."""
+
+    def test_bank_query_with_dates(self):
+        query = BANK_CONFIGS["kbank"].build_gmail_query(since="30d", until="7d")
+
+        assert query == (
+            "from:K-ElectronicDocument@kasikornbank.com has:attachment"
+            " newer_than:30d older_than:7d"
+        )
+
+    def test_empty_durations_are_ignored(self):
+        assert gmail_date_filter("", None) == ""
+        assert gmail_date_filter(None, "1w") == " older_than:1w"
@@ -0,0 +1,39 @@
+"""Tests for lazy imports in the thanakan_mail package."""
+
+import subprocess
+import sys
+
+import thanakan_mail
+
+
+HEAVY_MODULES = ("googleapiclient", "google.auth", "pikepdf")
+
+
+def test_import_skips_heavy_dependencies():
+    # Run in a fresh interpreter; other tests import these modules
+    code = (
+        "import sys, thanakan_mail; "
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_exports_resolve():
+    assert thanakan_mail.GmailProvider.__module__ == "thanakan_mail.provider"
+    assert thanakan_mail.unlock_pdf.__module__ == "thanakan_mail.unlock"
+    for name in thanakan_mail.__all__:
+        assert getattr(thanakan_mail, name) is not None
+    assert "GmailProvider" in dir(thanakan_mail)
+
+
+def test_unknown_attribute_raises():
+    try:
+        thanakan_mail.does_not_exist
+    except AttributeError as e:
+        assert "does_not_exist" in str(e)
+    else:
+        raise AssertionError("expected AttributeError")
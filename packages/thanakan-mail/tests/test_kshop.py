@@ -1,10 +1,16 @@
 """Tests for KShop email parsing."""
 
+import json
 from decimal import Decimal
 
 import pytest
 
-from thanakan_mail.kshop import KShopSummary, KShopParseError, parse_kshop_email
+from thanakan_mail.kshop import (
+    KShopSummary,
+    KShopParseError,
+    parse_kshop_email,
+    save_kshop_json,
+)
 from thanakan_mail.models import EmailMessage
 
 
@@ -173,3 +179,20 @@ class TestKShopSummaryModel:
             account_number="x",
         )
         assert summary.account_name == ""
+
+    def test_save_kshop_json(self, tmp_path):
+        summary = KShopSummary(
+            email_id="msg001",
+            email_date="Sat, 15 Feb 2026 10:30:00 +0700",
+            store_name="ร้านตัวอย่าง",
+            store_id="KB000000000001",
+            daily_amount=Decimal("4250.00"),
+            account_number="xxx-x-x0000-x",
+        )
+        output = tmp_path / "out" / "kshop.json"
+
+        save_kshop_json([summary], output)
+
+        text = output.read_text(encoding="utf-8")
+        assert "ร้านตัวอย่าง" in text
+        assert json.loads(text) == [summary.model_dump(mode="json")]
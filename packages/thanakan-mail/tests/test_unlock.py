@@ -10,6 +10,7 @@ from thanakan_mail.unlock import (
     save_password,
     clear_saved_password,
     unlock_pdf,
+    unlock_pdf_bytes,
     unlock_pdfs,
     is_pdf_encrypted,
     KEYRING_SERVICE,
@@ -219,6 +220,32 @@ class TestIsEncrypted:
         result = is_pdf_encrypted(tmp_path / "nonexistent.pdf")
         assert result is False
 
+    def test_returns_false_for_empty_file(self, tmp_path):
+        """Should return False for an empty file."""
+        empty = tmp_path / "empty.pdf"
+        empty.write_bytes(b"")
+        assert is_pdf_encrypted(empty) is False
+
+    def test_skips_pikepdf_without_encrypt_key(self, unencrypted_pdf):
+        """Should not open files that have no /Encrypt key."""
+        with patch("thanakan_mail.unlock.pikepdf.open") as mock_open:
+            assert is_pdf_encrypted(unencrypted_pdf) is False
+        mock_open.assert_not_called()
+
+    def test_confirms_encrypt_key_with_pikepdf(self, tmp_path, unencrypted_pdf):
+        """Should not trust a stray /Encrypt byte sequence on its own."""
+        pdf_path = tmp_path / "mentions_encrypt.pdf"
+        pdf_path.write_bytes(unencrypted_pdf.read_bytes() + b"\n% /Encrypt\n")
+        assert is_pdf_encrypted(pdf_path) is False
+
+    def test_detects_escaped_encrypt_key(self, tmp_path, encrypted_pdf):
+        """A #xx-escaped /Encrypt name (e.g. /Encr#79pt) still means encrypted."""
+        pdf_path = tmp_path / "escaped.pdf"
+        data = encrypted_pdf.read_bytes()
+        assert data.count(b"/Encrypt") == 1
+        pdf_path.write_bytes(data.replace(b"/Encrypt", b"/Encr#79pt"))
+        assert is_pdf_encrypted(pdf_path) is True
+
 
 class TestUnlockPdf:
     """Tests for unlock_pdf function."""
@@ -259,6 +286,30 @@ class TestUnlockPdf:
             unlock_pdf(tmp_path / "missing.pdf", password="test")
 
 
+class TestUnlockPdfBytes:
+    """Tests for unlock_pdf_bytes function."""
+
+    def test_unlocks_encrypted_bytes(self, encrypted_pdf, tmp_path):
+        """Should return unencrypted PDF content."""
+        result = unlock_pdf_bytes(encrypted_pdf.read_bytes(), password="user123")
+
+        output_path = tmp_path / "unlocked.pdf"
+        output_path.write_bytes(result)
+        assert not is_pdf_encrypted(output_path)
+        with pikepdf.open(output_path) as pdf:
+            assert len(pdf.pages) == 1
+
+    def test_raises_on_wrong_password(self, encrypted_pdf):
+        """Should raise PasswordError on wrong password."""
+        with pytest.raises(pikepdf.PasswordError):
+            unlock_pdf_bytes(encrypted_pdf.read_bytes(), password="wrongpass")
+
+    def test_raises_on_missing_password(self, encrypted_pdf):
+        """Should raise ValueError when password not provided."""
+        with pytest.raises(ValueError, match="Password is required"):
+            unlock_pdf_bytes(encrypted_pdf.read_bytes(), password="")
+
+
 class TestUnlockPdfs:
     """Tests for unlock_pdfs function."""
 
@@ -1,5 +1,5 @@
 from .models import Transaction, Statement, Account
-from .parser import parse_pdf, parse_all_pdfs
+from .parser import parse_pdf, parse_pdf_bytes, parse_all_pdfs
 from .consolidate import consolidate_by_account, validate_balance_continuity
 from .export import export_to_json, export_to_csv, export_to_excel
 
@@ -8,6 +8,7 @@ __all__ = [
     "Statement",
     "Account",
     "parse_pdf",
+    "parse_pdf_bytes",
     "parse_all_pdfs",
     "consolidate_by_account",
     "validate_balance_continuity",
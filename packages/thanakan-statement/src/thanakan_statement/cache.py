@@ -0,0 +1,133 @@
+"""On-disk cache of extracted PDF page text and parsed statements."""
+
+import hashlib
+import json
+import os
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from .models import Statement
+
+# Default cache directory (override with env THANAKAN_CACHE_DIR)
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("THANAKAN_CACHE_DIR", Path.home() / ".thanakan" / "cache")
+)
+
+# Leading bytes of the PDF hashed into the fingerprint
+FINGERPRINT_BYTES = 64 * 1024
+
+
+def page_texts_key(pdf_path: Path | str, backend: str) -> str:
+    """Build a cache key from a cheap fingerprint of the PDF file.
+
+    The fingerprint is the file size, mtime and a SHA-1 of the first
+    64 KB, plus the text extraction backend (backends lay text out
+    differently).
+
+    Args:
+        pdf_path: Path to PDF file
+        backend: Text extraction backend name
+
+    Returns:
+        Hex digest identifying this file's extracted text
+    """
+    stat = os.stat(pdf_path)
+    with open(pdf_path, "rb") as f:
+        head_digest = hashlib.sha1(f.read(FINGERPRINT_BYTES)).hexdigest()
+    fingerprint = f"{backend}:{stat.st_size}:{stat.st_mtime_ns}:{head_digest}"
+    return hashlib.sha1(fingerprint.encode()).hexdigest()
+
+
+def statement_key(pdf: Path | str | bytes, backend: str) -> str:
+    """Build a cache key from the SHA-256 of the whole PDF file.
+
+    Unlike page_texts_key this ignores the path and mtime, so the same
+    statement downloaded again to a new temp directory still hits. The
+    package version is included so parser fixes invalidate old entries.
+
+    Args:
+        pdf: Path to PDF file, or the PDF content itself
+        backend: Text extraction backend name
+
+    Returns:
+        Hex digest identifying this file's parsed statement
+    """
+    if isinstance(pdf, bytes):
+        content_digest = hashlib.sha256(pdf).hexdigest()
+    else:
+        with open(pdf, "rb") as f:
+            content_digest = hashlib.file_digest(f, "sha256").hexdigest()
+    fingerprint = f"statement:{_package_version()}:{backend}:{content_digest}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def _package_version() -> str:
+    try:
+        return version("thanakan-statement")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def load_page_texts(cache_dir: Path | str, key: str) -> list[str] | None:
+    """Load cached page texts.
+
+    Returns:
+        Page texts, or None on a cache miss or unreadable entry
+    """
+    try:
+        with open(Path(cache_dir) / f"{key}.json", encoding="utf-8") as f:
+            page_texts = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(page_texts, list):
+        return None
+    return page_texts
+
+
+def save_page_texts(cache_dir: Path | str, key: str, page_texts: list[str]) -> None:
+    """Save page texts to the cache (see _write_entry)."""
+    _write_entry(cache_dir, key, json.dumps(page_texts, ensure_ascii=False))
+
+
+def load_statement(cache_dir: Path | str, key: str) -> Statement | None:
+    """Load a cached parsed statement.
+
+    Returns:
+        Statement, or None on a cache miss or unreadable entry
+    """
+    try:
+        data = (Path(cache_dir) / f"{key}.json").read_bytes()
+        return Statement.model_validate_json(data)
+    except (OSError, ValidationError):
+        return None
+
+
+def save_statement(cache_dir: Path | str, key: str, statement: Statement) -> None:
+    """Save a parsed statement to the cache (see _write_entry)."""
+    _write_entry(cache_dir, key, statement.model_dump_json())
+
+
+def _write_entry(cache_dir: Path | str, key: str, content: str) -> None:
+    """Write a cache entry.
+
+    Entries hold decrypted statement data, so the directory is created
+    owner-only and files are written with mode 0600. Writes go through a
+    temp file and rename, so concurrent parses never see a partial entry.
+    Failures are ignored; the cache is best effort.
+    """
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
@@ -1,84 +1,147 @@
 """Export functions for account data (JSON, CSV, Excel)."""
 
 import csv
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 
 import openpyxl
 
 from .models import Account
 
+# Fetches every exported Transaction field in one call per row
+_TXN_FIELDS = attrgetter(
+    "date",
+    "time",
+    "description",
+    "channel",
+    "check_number",
+    "withdrawal",
+    "deposit",
+    "balance",
+    "reference",
+)
+
 
 def export_to_json(accounts: list[Account], output_path: Path | str) -> None:
     """Export accounts to JSON file.
 
+    Serializes one account at a time straight to the file, so only one
+    account's JSON is held in memory. Text is written as UTF-8 (Thai is
+    not escaped to \\uXXXX).
+
     Args:
         accounts: List of Account objects
         output_path: Path to output JSON file
     """
     output_path = Path(output_path)
-    data = [acc.model_dump(mode="json") for acc in accounts]
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    with open(output_path, "wb") as f:
+        f.write(b"[")
+        for i, account in enumerate(accounts):
+            f.write(b",\n" if i else b"\n")
+            f.write(account.__pydantic_serializer__.to_json(account, indent=2))
+        f.write(b"\n]" if accounts else b"]")
+
 
+def _write_account_csv(account: Account, output_path: Path) -> None:
+    """Write one account's transactions to a CSV file."""
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
 
-def export_to_csv(accounts: list[Account], output_dir: Path | str) -> None:
+        # Header
+        writer.writerow([
+            "Date",
+            "Time",
+            "Description",
+            "Channel",
+            "Check Number",
+            "Withdrawal",
+            "Deposit",
+            "Balance",
+            "Reference",
+        ])
+
+        # Transactions, preformatted as strings; Decimals are written as-is
+        # rather than round-tripped through float
+        writer.writerows(
+            (
+                str(txn_date),
+                str(txn_time) if txn_time else "",
+                description,
+                channel or "",
+                check_number or "",
+                f"{withdrawal:f}" if withdrawal else "",
+                f"{deposit:f}" if deposit else "",
+                f"{balance:f}",
+                reference or "",
+            )
+            for (
+                txn_date,
+                txn_time,
+                description,
+                channel,
+                check_number,
+                withdrawal,
+                deposit,
+                balance,
+                reference,
+            ) in map(_TXN_FIELDS, account.all_transactions)
+        )
+
+
+def export_to_csv(
+    accounts: list[Account],
+    output_dir: Path | str,
+    max_workers: int | None = 1,
+) -> None:
     """Export accounts to CSV files (one per account).
 
+    Files are written one after another by default. Pass max_workers to
+    write them in parallel worker processes instead; never more workers
+    than accounts are started.
+
     Args:
         accounts: List of Account objects
         output_dir: Directory for output CSV files
+        max_workers: Number of worker processes (default: 1 = serial,
+            None = CPU count)
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for account in accounts:
-        filename = f"{account.account_number.replace('-', '')}.csv"
-        output_path = output_dir / filename
-
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            # Header
-            writer.writerow([
-                "Date",
-                "Time",
-                "Description",
-                "Channel",
-                "Check Number",
-                "Withdrawal",
-                "Deposit",
-                "Balance",
-                "Reference",
-            ])
+    output_paths = [
+        output_dir / f"{account.account_number.replace('-', '')}.csv"
+        for account in accounts
+    ]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(accounts))
 
-            # Transactions
-            for txn in account.all_transactions:
-                writer.writerow([
-                    str(txn.date),
-                    str(txn.time) if txn.time else "",
-                    txn.description,
-                    txn.channel or "",
-                    txn.check_number or "",
-                    float(txn.withdrawal) if txn.withdrawal else "",
-                    float(txn.deposit) if txn.deposit else "",
-                    float(txn.balance),
-                    txn.reference or "",
-                ])
+    # Accounts sharing a number map to the same file; write those serially
+    # so the last one wins, rather than racing
+    if workers < 2 or len(set(output_paths)) < len(output_paths):
+        for account, output_path in zip(accounts, output_paths):
+            _write_account_csv(account, output_path)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Consume results so worker exceptions propagate to the caller
+        list(executor.map(_write_account_csv, accounts, output_paths))
 
 
 def export_to_excel(accounts: list[Account], output_path: Path | str) -> None:
     """Export accounts to Excel file.
 
-    Each account gets its own sheet.
+    Each account gets its own sheet. Rows are appended whole to a
+    write-only workbook, which streams them to disk instead of keeping a
+    cell object per value in memory.
 
     Args:
         accounts: List of Account objects
         output_path: Path to output Excel file
     """
     output_path = Path(output_path)
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    wb = openpyxl.Workbook(write_only=True)
 
     for account in accounts:
         # Create sheet with account number (sanitized for Excel)
@@ -86,7 +149,7 @@ def export_to_excel(accounts: list[Account], output_path: Path | str) -> None:
         ws = wb.create_sheet(sheet_name)
 
         # Header
-        headers = [
+        ws.append([
             "Date",
             "Time",
             "Description",
@@ -95,19 +158,29 @@ def export_to_excel(accounts: list[Account], output_path: Path | str) -> None:
             "Deposit",
             "Balance",
             "Reference",
-        ]
-        for col, header in enumerate(headers, 1):
-            ws.cell(row=1, column=col, value=header)
+        ])
 
         # Transactions
-        for row, txn in enumerate(account.all_transactions, 2):
-            ws.cell(row=row, column=1, value=str(txn.date))
-            ws.cell(row=row, column=2, value=str(txn.time) if txn.time else "")
-            ws.cell(row=row, column=3, value=txn.description)
-            ws.cell(row=row, column=4, value=txn.channel or "")
-            ws.cell(row=row, column=5, value=float(txn.withdrawal) if txn.withdrawal else None)
-            ws.cell(row=row, column=6, value=float(txn.deposit) if txn.deposit else None)
-            ws.cell(row=row, column=7, value=float(txn.balance))
-            ws.cell(row=row, column=8, value=txn.reference or "")
+        for (
+            txn_date,
+            txn_time,
+            description,
+            channel,
+            _check_number,
+            withdrawal,
+            deposit,
+            balance,
+            reference,
+        ) in map(_TXN_FIELDS, account.all_transactions):
+            ws.append([
+                str(txn_date),
+                str(txn_time) if txn_time else "",
+                description,
+                channel or "",
+                float(withdrawal) if withdrawal else None,
+                float(deposit) if deposit else None,
+                float(balance),
+                reference or "",
+            ])
 
     wb.save(output_path)
@@ -12,7 +12,7 @@ class TransactionType(str, Enum):
 
 
 # Withdrawal keywords (Thai and English)
-WITHDRAWAL_KEYWORDS: list[str] = [
+WITHDRAWAL_KEYWORDS: tuple[str, ...] = (
     # KBank - English
     "Transfer Withdrawal",
     "Debit Card Spending",
@@ -36,10 +36,10 @@ WITHDRAWAL_KEYWORDS: list[str] = [
     "TRF. PROMPTPAY",
     "BILL PAY E-CHN",
     "BILL PAY",
-]
+)
 
 # Deposit keywords (Thai and English)
-DEPOSIT_KEYWORDS: list[str] = [
+DEPOSIT_KEYWORDS: tuple[str, ...] = (
     # KBank - English
     "Transfer Deposit",
     "Payment Received",
@@ -57,23 +57,26 @@ DEPOSIT_KEYWORDS: list[str] = [
     "CASH DEP NBK",
     "CASH DEP",
     "TR FR/TO S/A",
-]
+)
 
 # Beginning balance keywords
-BALANCE_BEGIN_KEYWORDS: list[str] = [
+BALANCE_BEGIN_KEYWORDS: tuple[str, ...] = (
     "Beginning Balance",
     "ยอดยกมา",
     "B/F",  # BBL: Brought Forward
-]
+)
 
 # Ending balance keywords
-BALANCE_END_KEYWORDS: list[str] = [
+BALANCE_END_KEYWORDS: tuple[str, ...] = (
     "Ending Balance",
     "ยอดยกไป",
-]
+)
+
+# Beginning/ending balance lines are not transactions
+BALANCE_SKIP_KEYWORDS: tuple[str, ...] = BALANCE_BEGIN_KEYWORDS + BALANCE_END_KEYWORDS
 
 # Channel keywords
-CHANNEL_KEYWORDS: list[str] = [
+CHANNEL_KEYWORDS: tuple[str, ...] = (
     # KBank
     "K PLUS",
     "K-Plus",
@@ -87,10 +90,10 @@ CHANNEL_KEYWORDS: list[str] = [
     # BBL
     "mPhone",
     "Gtway",
-]
+)
 
 
-def get_balance_keywords() -> dict[str, list[str]]:
+def get_balance_keywords() -> dict[str, tuple[str, ...]]:
     """Get balance keywords grouped by type."""
     return {
         "beginning": BALANCE_BEGIN_KEYWORDS,
@@ -98,16 +101,16 @@ def get_balance_keywords() -> dict[str, list[str]]:
     }
 
 
-def get_withdrawal_keywords() -> list[str]:
+def get_withdrawal_keywords() -> tuple[str, ...]:
     """Get all withdrawal keywords."""
     return WITHDRAWAL_KEYWORDS
 
 
-def get_deposit_keywords() -> list[str]:
+def get_deposit_keywords() -> tuple[str, ...]:
     """Get all deposit keywords."""
     return DEPOSIT_KEYWORDS
 
 
-def get_channel_keywords() -> list[str]:
+def get_channel_keywords() -> tuple[str, ...]:
     """Get all channel keywords."""
     return CHANNEL_KEYWORDS
@@ -19,6 +19,17 @@ class Transaction(BaseModel):
     reference: str | None = None
     check_number: str | None = None  # BBL: Chq.No. field
 
+    def _dedup_key(self) -> tuple:
+        """Fields that identify the same transaction across statements."""
+        return (
+            self.date,
+            self.time,
+            self.description,
+            self.balance,
+            self.withdrawal,
+            self.deposit,
+        )
+
 
 class Statement(BaseModel):
     """A single bank statement from one PDF."""
@@ -54,12 +65,15 @@ class Account(BaseModel):
 
     def _merge_transactions(self) -> None:
         """Merge and deduplicate transactions from all statements."""
-        all_txns: set[Transaction] = set()
+        # Keyed in statement order, so the first copy of each transaction
+        # keeps its document position
+        unique: dict[tuple, Transaction] = {}
         for stmt in self.statements:
             for txn in stmt.transactions:
-                all_txns.add(txn)
-        # Sort by date, then time
+                unique.setdefault(txn._dedup_key(), txn)
+        # Sort by date, then time; the sort is stable, so same-day
+        # transactions without a time stay in document order
         self.all_transactions = sorted(
-            all_txns,
+            unique.values(),
             key=lambda t: (t.date, t.time or dt.time(0, 0)),
         )
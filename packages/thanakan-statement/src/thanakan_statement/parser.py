@@ -3,44 +3,130 @@
 import io
 import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, time
 from decimal import Decimal
+from functools import lru_cache
+from itertools import islice, repeat
 from pathlib import Path
 
 import pdfplumber
 import pikepdf
 
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+from .cache import (
+    load_page_texts,
+    load_statement,
+    page_texts_key,
+    save_page_texts,
+    save_statement,
+    statement_key,
+)
 from .models import Statement, Transaction
 from .keywords import (
-    get_balance_keywords,
-    get_channel_keywords,
-    get_deposit_keywords,
-    get_withdrawal_keywords,
+    BALANCE_BEGIN_KEYWORDS,
+    BALANCE_END_KEYWORDS,
+    BALANCE_SKIP_KEYWORDS,
+    CHANNEL_KEYWORDS,
+    DEPOSIT_KEYWORDS,
+    WITHDRAWAL_KEYWORDS,
 )
 
 # Default PDF password from environment
 DEFAULT_PASSWORD = os.environ.get("PDF_PASS")
 
+# Text extraction backend: "pdfplumber" (default) or "pymupdf" (faster,
+# needs the optional pymupdf package; falls back to pdfplumber without it)
+PDF_BACKEND = os.environ.get("THANAKAN_PDF_BACKEND", "pdfplumber")
+
 # Bank type constants
 BANK_KBANK = "kbank"
 BANK_BBL = "bbl"
 BANK_SCB = "scb"
 
+# Channel keywords paired with their lowercase form for case-insensitive lookup
+_CHANNEL_KEYWORDS_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (kw, kw.lower()) for kw in CHANNEL_KEYWORDS
+)
+
+
+# Bank markers in PDF text, scanned together in one pass
+_BANK_MARKERS: dict[str, str] = {
+    "SIAM COMMERCIAL": BANK_SCB,
+    "ไทยพาณิชย์": BANK_SCB,
+    "SCB": BANK_SCB,
+    "Bangkok Bank": BANK_BBL,
+    "ธนาคารกรุงเทพ": BANK_BBL,
+    "Bualuang": BANK_BBL,
+}
+_BANK_MARKER_RE = re.compile("|".join(map(re.escape, _BANK_MARKERS)))
+
 
 def detect_bank_type(text: str) -> str:
     """Detect bank type from PDF content.
 
+    SCB markers take precedence over BBL ones, so the scan stops at the
+    first SCB marker and otherwise reports BBL if any BBL marker was seen.
+
     Args:
         text: Full PDF text content
 
     Returns:
         Bank type: "scb", "bbl", or "kbank" (default)
     """
-    if "SIAM COMMERCIAL" in text or "ไทยพาณิชย์" in text or "SCB" in text:
-        return BANK_SCB
-    if "Bangkok Bank" in text or "ธนาคารกรุงเทพ" in text or "Bualuang" in text:
-        return BANK_BBL
-    return BANK_KBANK  # default
+    found = BANK_KBANK  # default
+    for match in _BANK_MARKER_RE.finditer(text):
+        bank = _BANK_MARKERS[match.group()]
+        if bank == BANK_SCB:
+            return BANK_SCB
+        found = bank
+    return found
+
+
+# Thai-specific header/label keywords (not transaction descriptions)
+THAI_HEADER_KEYWORDS: tuple[str, ...] = (
+    "ยอดยกมา",  # Beginning balance
+    "ยอดยกไป",  # Ending balance
+    "รอบระหว่างวันที่",  # Period
+    "ชื่อบัญชี",  # Account name
+    "เลขที่บัญชี",  # Account number
+    "ยอดรวมถอน",  # Total withdrawal
+    "ยอดรวมฝาก",  # Total deposit
+    "ยอดคงเหลือ",  # Balance
+    "รายละเอียด",  # Details
+)
+
+# English-specific header/label keywords
+ENGLISH_HEADER_KEYWORDS: tuple[str, ...] = (
+    "Beginning Balance",
+    "Ending Balance",
+    "Period",
+    "Account Number",
+    "Account Name",
+    "Total Withdrawal",
+    "Total Deposit",
+    "Outstanding Balance",
+    "Descriptions",
+)
+
+# Minimum Thai characters for the language fallback to call a PDF Thai
+THAI_CHAR_THRESHOLD = 200
+
+_THAI_CHAR_RE = re.compile(r"[\u0e00-\u0e7f]")
+
+
+def has_thai_chars(text: str, minimum: int) -> bool:
+    """Check whether text contains more than ``minimum`` Thai characters.
+
+    Stops scanning as soon as the threshold is crossed instead of
+    counting every Thai character in the text.
+    """
+    return next(islice(_THAI_CHAR_RE.finditer(text), minimum, None), None) is not None
 
 
 def detect_pdf_language(text: str) -> str:
@@ -55,34 +141,8 @@ def detect_pdf_language(text: str) -> str:
     Returns:
         "th" for Thai, "en" for English
     """
-    # Thai-specific header/label keywords (not transaction descriptions)
-    thai_header_keywords = [
-        "ยอดยกมา",  # Beginning balance
-        "ยอดยกไป",  # Ending balance
-        "รอบระหว่างวันที่",  # Period
-        "ชื่อบัญชี",  # Account name
-        "เลขที่บัญชี",  # Account number
-        "ยอดรวมถอน",  # Total withdrawal
-        "ยอดรวมฝาก",  # Total deposit
-        "ยอดคงเหลือ",  # Balance
-        "รายละเอียด",  # Details
-    ]
-
-    # English-specific header/label keywords
-    english_header_keywords = [
-        "Beginning Balance",
-        "Ending Balance",
-        "Period",
-        "Account Number",
-        "Account Name",
-        "Total Withdrawal",
-        "Total Deposit",
-        "Outstanding Balance",
-        "Descriptions",
-    ]
-
-    thai_keyword_count = sum(1 for kw in thai_header_keywords if kw in text)
-    english_keyword_count = sum(1 for kw in english_header_keywords if kw in text)
+    thai_keyword_count = sum(1 for kw in THAI_HEADER_KEYWORDS if kw in text)
+    english_keyword_count = sum(1 for kw in ENGLISH_HEADER_KEYWORDS if kw in text)
 
     # Prefer keyword matching over character counting
     if thai_keyword_count > english_keyword_count:
@@ -92,8 +152,7 @@ def detect_pdf_language(text: str) -> str:
 
     # Fallback: count Thai characters in significant portions
     # (Thai headers tend to have more Thai characters than just addresses)
-    thai_char_count = sum(1 for char in text if "\u0e00" <= char <= "\u0e7f")
-    if thai_char_count > 200:
+    if has_thai_chars(text, THAI_CHAR_THRESHOLD):
         return "th"
 
     return "en"
@@ -115,6 +174,48 @@ def decrypt_pdf(pdf_path: Path | str, password: str = DEFAULT_PASSWORD) -> bytes
         return output.getvalue()
 
 
+class _PyMuPDFPage:
+    """pdfplumber-style page wrapper over a PyMuPDF page."""
+
+    def __init__(self, page) -> None:
+        self._page = page
+
+    def extract_text(self) -> str:
+        return self._page.get_text("text", sort=True)
+
+
+class _PyMuPDFDocument:
+    """pdfplumber-style document wrapper over a PyMuPDF document."""
+
+    def __init__(self, pdf_file: io.BytesIO | str) -> None:
+        if isinstance(pdf_file, io.BytesIO):
+            self._doc = pymupdf.open(stream=pdf_file.getvalue(), filetype="pdf")
+        else:
+            self._doc = pymupdf.open(pdf_file)
+        self.pages = [_PyMuPDFPage(page) for page in self._doc]
+
+    def __enter__(self) -> "_PyMuPDFDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._doc.close()
+
+
+def _active_backend() -> str:
+    """Text extraction backend in effect, after the pymupdf fallback."""
+    if PDF_BACKEND == "pymupdf" and pymupdf is not None:
+        return "pymupdf"
+    return "pdfplumber"
+
+
+def _open_pdf(pdf_file: io.BytesIO | str):
+    """Open a PDF with the configured text extraction backend."""
+    if _active_backend() == "pymupdf":
+        return _PyMuPDFDocument(pdf_file)
+    return pdfplumber.open(pdf_file)
+
+
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> date:
     """Parse date from DD-MM-YY format.
 
@@ -130,6 +231,13 @@ def parse_date(date_str: str) -> date:
     return date(full_year, int(month), int(day))
 
 
+@lru_cache(maxsize=4096)
+def _parse_ddmmyy(date_str: str) -> date:
+    """Parse date from DD/MM/YY format (BBL, SCB)."""
+    day, month, year = date_str.split("/")
+    return date(2000 + int(year), int(month), int(day))
+
+
 def parse_time(time_str: str) -> time | None:
     """Parse time from HH:MM format.
 
@@ -148,9 +256,12 @@ def parse_time(time_str: str) -> time | None:
         return None
 
 
+@lru_cache(maxsize=8192)
 def parse_amount(amount_str: str) -> Decimal | None:
     """Parse amount string to Decimal.
 
+    Results are cached since balances and amounts repeat across lines.
+
     Args:
         amount_str: Amount string (e.g., "8,400.00")
 
@@ -166,6 +277,42 @@ def parse_amount(amount_str: str) -> Decimal | None:
         return None
 
 
+@lru_cache(maxsize=8192)
+def _parse_amount_token(token: str) -> Decimal:
+    """Parse an amount token captured by one of the amount regexes.
+
+    The regex already guarantees a "1,234.56" shaped token, so the blank
+    check, strip and error handling of parse_amount are skipped.
+    """
+    return Decimal(token.replace(",", ""))
+
+
+# Amount with thousands separators and two decimals, e.g. "8,400.00"
+_AMOUNT_RE = re.compile(r"([\d,]++\.\d{2})")
+
+# Account number shared by KBank and BBL: XXX-X-XXXXX-X
+_ACC_RE = re.compile(r"(\d{3}-\d-\d{5}-\d)")
+
+# KBank header and transaction line patterns
+_KBANK_PERIOD_RE = re.compile(
+    r"(?:Period|รอบระหว่างวันที่)\s+(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})"
+)
+_KBANK_NAME_EN_RE = re.compile(r"Account\s*(MR\.|MS\.|MRS\.)\s*(.+?)(?:\s+Reference|$)")
+_KBANK_NAME_TH_RE = re.compile(r"ชื่อบัญชี\s+(นาย|นาง|น\.ส\.)\s+(.+?)(?:\s+เลขที่|$)")
+_KBANK_NAME_LABEL_RE = re.compile(r"Account Name\s*:\s*(.+?)(?:\n|Account)")
+_KBANK_BEGIN_RES = tuple(
+    re.compile(rf"{re.escape(kw)}\s+([\d,]+\.\d{{2}})") for kw in BALANCE_BEGIN_KEYWORDS
+)
+_KBANK_END_RES = tuple(
+    re.compile(rf"{re.escape(kw)}\s+([\d,]+\.\d{{2}})") for kw in BALANCE_END_KEYWORDS
+)
+_KBANK_DATE_RE = re.compile(r"^(\d{2}-\d{2}-\d{2})\s+")
+_KBANK_TIME_RE = re.compile(r"^\d{2}-\d{2}-\d{2}\s+(\d{2}:\d{2})\s+")
+_KBANK_DESC_TIME_RE = re.compile(r"^\d{2}-\d{2}-\d{2}\s+\d{2}:\d{2}\s+(.+?)(?:\d[\d,]*\.\d{2})")
+_KBANK_DESC_RE = re.compile(r"^\d{2}-\d{2}-\d{2}\s+(.+?)(?:\d[\d,]*\.\d{2})")
+_KBANK_REF_RE = re.compile(r"(?:Ref\.|Reference|REF)\s*:?\s*(\S+)", re.IGNORECASE)
+
+
 def extract_account_info(text: str) -> tuple[str | None, str | None, date | None, date | None]:
     """Extract account info from PDF header text.
 
@@ -178,13 +325,13 @@ def extract_account_info(text: str) -> tuple[str | None, str | None, date | None
     period_end = None
 
     # Account number pattern: XXX-X-XXXXX-X
-    acc_match = re.search(r"(\d{3}-\d-\d{5}-\d)", text)
+    acc_match = _ACC_RE.search(text)
     if acc_match:
         account_number = acc_match.group(1)
 
     # Period pattern: "Period DD/MM/YYYY - DD/MM/YYYY" (English)
     # or "รอบระหว่างวันที่ DD/MM/YYYY - DD/MM/YYYY" (Thai)
-    period_match = re.search(r"(?:Period|รอบระหว่างวันที่)\s+(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})", text)
+    period_match = _KBANK_PERIOD_RE.search(text)
     if period_match:
         # Parse DD/MM/YYYY format
         start_parts = period_match.group(1).split("/")
@@ -193,19 +340,19 @@ def extract_account_info(text: str) -> tuple[str | None, str | None, date | None
         period_end = date(int(end_parts[2]), int(end_parts[1]), int(end_parts[0]))
 
     # Account name - pattern "AccountMR. Name..." or "ชื่อบัญชี นาย/นาง/น.ส. Name"
-    name_match = re.search(r"Account\s*(MR\.|MS\.|MRS\.)\s*(.+?)(?:\s+Reference|$)", text)
+    name_match = _KBANK_NAME_EN_RE.search(text)
     if name_match:
         account_name = f"{name_match.group(1)} {name_match.group(2)}".strip()
     else:
         # Thai pattern: ชื่อบัญชี นาย/นาง/น.ส. Name
-        name_match = re.search(r"ชื่อบัญชี\s+(นาย|นาง|น\.ส\.)\s+(.+?)(?:\s+เลขที่|$)", text)
+        name_match = _KBANK_NAME_TH_RE.search(text)
         if name_match:
             # Convert Thai prefix to English
             prefix_map = {"นาย": "MR.", "นาง": "MRS.", "น.ส.": "MS."}
             prefix = prefix_map.get(name_match.group(1), name_match.group(1))
             account_name = f"{prefix} {name_match.group(2)}".strip()
         else:
-            name_match = re.search(r"Account Name\s*:\s*(.+?)(?:\n|Account)", text)
+            name_match = _KBANK_NAME_LABEL_RE.search(text)
             if name_match:
                 account_name = name_match.group(1).strip()
 
@@ -220,25 +367,33 @@ def extract_balances(text: str) -> tuple[Decimal | None, Decimal | None]:
     """
     opening = None
     closing = None
-    balance_keywords = get_balance_keywords()
 
     # Beginning Balance (English or Thai)
-    for keyword in balance_keywords["beginning"]:
-        begin_match = re.search(rf"{re.escape(keyword)}\s+([\d,]+\.\d{{2}})", text)
+    for begin_re in _KBANK_BEGIN_RES:
+        begin_match = begin_re.search(text)
         if begin_match:
-            opening = parse_amount(begin_match.group(1))
+            opening = _parse_amount_token(begin_match.group(1))
             break
 
     # Ending Balance (English or Thai)
-    for keyword in balance_keywords["ending"]:
-        end_match = re.search(rf"{re.escape(keyword)}\s+([\d,]+\.\d{{2}})", text)
+    for end_re in _KBANK_END_RES:
+        end_match = end_re.search(text)
         if end_match:
-            closing = parse_amount(end_match.group(1))
+            closing = _parse_amount_token(end_match.group(1))
             break
 
     return opening, closing
 
 
+def _find_channel(line: str) -> str | None:
+    """Return the first channel keyword found in line (case-insensitive)."""
+    line_lower = line.lower()
+    for kw, kw_lower in _CHANNEL_KEYWORDS_LOWER:
+        if kw_lower in line_lower:
+            return kw
+    return None
+
+
 def parse_transaction_line(line: str) -> Transaction | None:
     """Parse a single KBank transaction line.
 
@@ -249,17 +404,14 @@ def parse_transaction_line(line: str) -> Transaction | None:
         Transaction object or None
     """
     # Pattern: DD-MM-YY [HH:MM] DESCRIPTION AMOUNT(S) BALANCE CHANNEL DETAILS
-    date_pattern = re.compile(r"^(\d{2}-\d{2}-\d{2})\s+")
-    match = date_pattern.match(line)
+    match = _KBANK_DATE_RE.match(line)
     if not match:
         return None
 
     date_str = match.group(1)
 
     # Skip Beginning/Ending Balance lines (Thai and English)
-    balance_keywords = get_balance_keywords()
-    balance_skip_keywords = balance_keywords["beginning"] + balance_keywords["ending"]
-    if any(kw in line for kw in balance_skip_keywords):
+    if any(kw in line for kw in BALANCE_SKIP_KEYWORDS):
         return None
 
     try:
@@ -268,21 +420,20 @@ def parse_transaction_line(line: str) -> Transaction | None:
         return None
 
     # Extract time if present
-    time_match = re.search(r"^\d{2}-\d{2}-\d{2}\s+(\d{2}:\d{2})\s+", line)
+    time_match = _KBANK_TIME_RE.match(line)
     txn_time = parse_time(time_match.group(1)) if time_match else None
 
     # Find all amounts (numbers with commas and decimals)
-    amount_pattern = re.compile(r"([\d,]+\.\d{2})")
-    amounts = amount_pattern.findall(line)
+    amounts = _AMOUNT_RE.findall(line)
 
     if not amounts:
         return None
 
     # Extract description (between date/time and first amount)
     if txn_time:
-        desc_match = re.search(r"^\d{2}-\d{2}-\d{2}\s+\d{2}:\d{2}\s+(.+?)(?:\d[\d,]*\.\d{2})", line)
+        desc_match = _KBANK_DESC_TIME_RE.match(line)
     else:
-        desc_match = re.search(r"^\d{2}-\d{2}-\d{2}\s+(.+?)(?:\d[\d,]*\.\d{2})", line)
+        desc_match = _KBANK_DESC_RE.match(line)
 
     description = desc_match.group(1).strip() if desc_match else ""
 
@@ -292,42 +443,35 @@ def parse_transaction_line(line: str) -> Transaction | None:
     balance = None
 
     # Use keyword lists for bilingual support
-    withdrawal_keywords = get_withdrawal_keywords()
-    deposit_keywords = get_deposit_keywords()
-    is_withdrawal = any(kw in line for kw in withdrawal_keywords) and not any(kw in line for kw in deposit_keywords)
-    is_deposit = any(kw in line for kw in deposit_keywords)
+    is_deposit = any(kw in line for kw in DEPOSIT_KEYWORDS)
+    is_withdrawal = not is_deposit and any(kw in line for kw in WITHDRAWAL_KEYWORDS)
 
     if len(amounts) >= 2:
         # Usually: amount, balance
         if is_withdrawal:
-            withdrawal = parse_amount(amounts[0])
-            balance = parse_amount(amounts[-1])
+            withdrawal = _parse_amount_token(amounts[0])
+            balance = _parse_amount_token(amounts[-1])
         elif is_deposit:
-            deposit = parse_amount(amounts[0])
-            balance = parse_amount(amounts[-1])
+            deposit = _parse_amount_token(amounts[0])
+            balance = _parse_amount_token(amounts[-1])
         else:
             # Default: try to guess from position
-            balance = parse_amount(amounts[-1])
+            balance = _parse_amount_token(amounts[-1])
             # If balance decreased, it's a withdrawal
             # We'll need to track balance to know for sure
-            withdrawal = parse_amount(amounts[0])
+            withdrawal = _parse_amount_token(amounts[0])
     elif len(amounts) == 1:
-        balance = parse_amount(amounts[0])
+        balance = _parse_amount_token(amounts[0])
 
     if balance is None:
         return None
 
     # Extract channel using keywords
-    channel = None
-    channel_keywords = get_channel_keywords()
-    for kw in channel_keywords:
-        if kw.lower() in line.lower():
-            channel = kw
-            break
+    channel = _find_channel(line)
 
     # Extract reference (usually at the end, after channel)
     reference = None
-    ref_match = re.search(r"(?:Ref\.|Reference|REF)\s*:?\s*(\S+)", line, re.IGNORECASE)
+    ref_match = _KBANK_REF_RE.search(line)
     if ref_match:
         reference = ref_match.group(1)
 
@@ -347,6 +491,20 @@ def parse_transaction_line(line: str) -> Transaction | None:
 # BBL (Bangkok Bank) specific parsing functions
 # =============================================================================
 
+_BBL_BRANCH_RE = re.compile(r"(\d{4}\s+[A-Z\s]+BRANCH)")
+_BBL_BRANCH_TH_RE = re.compile(r"(\d{4}\s+สาขา[ก-๙\s]+)")
+_BBL_CURRENCY_RE = re.compile(r"(?:Currency|สกุลเงิน/Currency)\s+([A-Z]{3})")
+_BBL_PERIOD_RE = re.compile(
+    r"(?:Statement Period|รอบรายการบัญชี\s*/\s*Statement Period)\s+(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})"
+)
+_BBL_NAME_RE = re.compile(r"Name\s+((?:MR|MRS|MS)\s+[A-Z\s]+?)(?:\s+เลขที่|Account|\n)")
+_BBL_NAME_TH_RE = re.compile(r"ชื่อ/Name\s+((?:นาย|นาง|นางสาว)\s+[ก-๙\s]+?)(?:\s+เลขที่)")
+_BBL_BF_RE = re.compile(r"B/F\s+([\d,]+\.\d{2})")
+_BBL_DATE_RE = re.compile(r"^(\d{2}/\d{2}/\d{2})\s+")
+_BBL_DESC_RE = re.compile(r"^\d{2}/\d{2}/\d{2}\s+(.+?)(?:\d[\d,]*\.\d{2})")
+_BBL_BRANCH_CHANNEL_RE = re.compile(r"(BR\d{4})\s+([A-Z]+)")
+_BBL_BRANCH_CODE_RE = re.compile(r"\b(BR\d{4})\b")
+
 
 def extract_account_info_bbl(
     text: str,
@@ -373,22 +531,22 @@ def extract_account_info_bbl(
     # Branch patterns:
     # English: "0369 KUMPHAWAPI BRANCH"
     # Thai: "0369 สาขากุมภวาปี"
-    branch_match = re.search(r"(\d{4}\s+[A-Z\s]+BRANCH)", text)
+    branch_match = _BBL_BRANCH_RE.search(text)
     if branch_match:
         branch = branch_match.group(1).strip()
     else:
         # Thai branch: 4 digits + สาขา + Thai text
-        branch_match = re.search(r"(\d{4}\s+สาขา[ก-๙\s]+)", text)
+        branch_match = _BBL_BRANCH_TH_RE.search(text)
         if branch_match:
             branch = branch_match.group(1).strip()
 
     # Account number pattern: XXX-X-XXXXX-X
-    acc_match = re.search(r"(\d{3}-\d-\d{5}-\d)", text)
+    acc_match = _ACC_RE.search(text)
     if acc_match:
         account_number = acc_match.group(1)
 
     # Currency pattern: "Currency THB" or "สกุลเงิน/Currency THB"
-    currency_match = re.search(r"(?:Currency|สกุลเงิน/Currency)\s+([A-Z]{3})", text)
+    currency_match = _BBL_CURRENCY_RE.search(text)
     if currency_match:
         currency = currency_match.group(1)
     else:
@@ -397,10 +555,7 @@ def extract_account_info_bbl(
     # Period patterns:
     # English: "Statement Period DD/MM/YYYY - DD/MM/YYYY"
     # Thai: "รอบรายการบัญชี / Statement Period DD/MM/YYYY - DD/MM/YYYY"
-    period_match = re.search(
-        r"(?:Statement Period|รอบรายการบัญชี\s*/\s*Statement Period)\s+(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})",
-        text,
-    )
+    period_match = _BBL_PERIOD_RE.search(text)
     if period_match:
         start_parts = period_match.group(1).split("/")
         end_parts = period_match.group(2).split("/")
@@ -411,12 +566,12 @@ def extract_account_info_bbl(
     # English: "Name MR/MRS/MS NAME"
     # Thai: "ชื่อ/Name นาย/นาง/นางสาว NAME"
     # Try English first
-    name_match = re.search(r"Name\s+((?:MR|MRS|MS)\s+[A-Z\s]+?)(?:\s+เลขที่|Account|\n)", text)
+    name_match = _BBL_NAME_RE.search(text)
     if name_match:
         account_name = name_match.group(1).strip()
     else:
         # Try Thai: ชื่อ/Name followed by Thai honorific + name
-        name_match = re.search(r"ชื่อ/Name\s+((?:นาย|นาง|นางสาว)\s+[ก-๙\s]+?)(?:\s+เลขที่)", text)
+        name_match = _BBL_NAME_TH_RE.search(text)
         if name_match:
             account_name = name_match.group(1).strip()
 
@@ -437,9 +592,9 @@ def extract_balances_bbl(text: str) -> tuple[Decimal | None, Decimal | None]:
     closing = None
 
     # B/F (Brought Forward) = Beginning Balance
-    bf_match = re.search(r"B/F\s+([\d,]+\.\d{2})", text)
+    bf_match = _BBL_BF_RE.search(text)
     if bf_match:
-        opening = parse_amount(bf_match.group(1))
+        opening = _parse_amount_token(bf_match.group(1))
 
     # Find all transaction lines and get the balance (second-to-last column before channel)
     # BBL format: DD/MM/YY DESCRIPTION [withdrawal] [deposit] balance channel
@@ -449,14 +604,14 @@ def extract_balances_bbl(text: str) -> tuple[Decimal | None, Decimal | None]:
 
     for line in lines:
         # Check if line starts with a date
-        if re.match(r"^\d{2}/\d{2}/\d{2}\s+", line) and "B/F" not in line:
+        if _BBL_DATE_RE.match(line) and "B/F" not in line:
             # Find all amounts on this line
-            amounts = re.findall(r"([\d,]+\.\d{2})", line)
+            amounts = _AMOUNT_RE.findall(line)
             if len(amounts) >= 2:
                 # Last amount is the balance
-                last_balance = parse_amount(amounts[-1])
+                last_balance = _parse_amount_token(amounts[-1])
             elif len(amounts) == 1:
-                last_balance = parse_amount(amounts[0])
+                last_balance = _parse_amount_token(amounts[0])
 
     if last_balance is not None:
         closing = last_balance
@@ -480,8 +635,7 @@ def parse_transaction_line_bbl(line: str) -> Transaction | None:
         Transaction object or None
     """
     # Pattern: DD/MM/YY at start
-    date_pattern = re.compile(r"^(\d{2}/\d{2}/\d{2})\s+")
-    match = date_pattern.match(line)
+    match = _BBL_DATE_RE.match(line)
     if not match:
         return None
 
@@ -493,9 +647,7 @@ def parse_transaction_line_bbl(line: str) -> Transaction | None:
 
     # Parse date (DD/MM/YY format)
     try:
-        day, month, year = date_str.split("/")
-        full_year = 2000 + int(year)
-        txn_date = date(full_year, int(month), int(day))
+        txn_date = _parse_ddmmyy(date_str)
     except Exception:
         return None
 
@@ -503,14 +655,13 @@ def parse_transaction_line_bbl(line: str) -> Transaction | None:
     txn_time = None
 
     # Find all amounts (numbers with commas and decimals)
-    amount_pattern = re.compile(r"([\d,]+\.\d{2})")
-    amounts = amount_pattern.findall(line)
+    amounts = _AMOUNT_RE.findall(line)
 
     if not amounts:
         return None
 
     # Extract description - everything between date and first amount
-    desc_match = re.search(r"^\d{2}/\d{2}/\d{2}\s+(.+?)(?:\d[\d,]*\.\d{2})", line)
+    desc_match = _BBL_DESC_RE.match(line)
     description = desc_match.group(1).strip() if desc_match else ""
 
     # Extract check number if present (between description and amounts)
@@ -524,29 +675,24 @@ def parse_transaction_line_bbl(line: str) -> Transaction | None:
     balance = None
 
     # Use keyword lists
-    withdrawal_keywords = get_withdrawal_keywords()
-    deposit_keywords = get_deposit_keywords()
-
-    is_withdrawal = any(kw in line for kw in withdrawal_keywords) and not any(
-        kw in line for kw in deposit_keywords
-    )
-    is_deposit = any(kw in line for kw in deposit_keywords)
+    is_deposit = any(kw in line for kw in DEPOSIT_KEYWORDS)
+    is_withdrawal = not is_deposit and any(kw in line for kw in WITHDRAWAL_KEYWORDS)
 
     # BBL format: amounts are in order [withdrawal] [deposit] balance
     # But typically only one of withdrawal/deposit is present
     if len(amounts) >= 2:
         if is_withdrawal:
-            withdrawal = parse_amount(amounts[0])
-            balance = parse_amount(amounts[-1])
+            withdrawal = _parse_amount_token(amounts[0])
+            balance = _parse_amount_token(amounts[-1])
         elif is_deposit:
-            deposit = parse_amount(amounts[0])
-            balance = parse_amount(amounts[-1])
+            deposit = _parse_amount_token(amounts[0])
+            balance = _parse_amount_token(amounts[-1])
         else:
             # Default: assume withdrawal if can't determine
-            balance = parse_amount(amounts[-1])
-            withdrawal = parse_amount(amounts[0])
+            balance = _parse_amount_token(amounts[-1])
+            withdrawal = _parse_amount_token(amounts[0])
     elif len(amounts) == 1:
-        balance = parse_amount(amounts[0])
+        balance = _parse_amount_token(amounts[0])
 
     if balance is None:
         return None
@@ -555,21 +701,17 @@ def parse_transaction_line_bbl(line: str) -> Transaction | None:
     channel = None
 
     # Check for branch channel with name (e.g., "BR0369 KUMPHAWAPI")
-    branch_channel_match = re.search(r"(BR\d{4})\s+([A-Z]+)", line)
+    branch_channel_match = _BBL_BRANCH_CHANNEL_RE.search(line)
     if branch_channel_match:
         channel = f"{branch_channel_match.group(1)} {branch_channel_match.group(2)}"
     else:
         # Check for simple branch channel (BR####)
-        branch_match = re.search(r"\b(BR\d{4})\b", line)
+        branch_match = _BBL_BRANCH_CODE_RE.search(line)
         if branch_match:
             channel = branch_match.group(1)
         else:
             # Check for other channel keywords
-            channel_keywords = get_channel_keywords()
-            for kw in channel_keywords:
-                if kw.lower() in line.lower():
-                    channel = kw
-                    break
+            channel = _find_channel(line)
 
     return Transaction(
         date=txn_date,
@@ -588,6 +730,33 @@ def parse_transaction_line_bbl(line: str) -> Transaction | None:
 # SCB (Siam Commercial Bank) specific parsing functions
 # =============================================================================
 
+_SCB_BRANCH_RE = re.compile(r"^([A-Z][A-Z ]+BRANCH)$", re.MULTILINE)
+_SCB_ACC_RE = re.compile(r"(\d{3}-\d{6}-\d)")
+_SCB_PERIOD_RE = re.compile(r"(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})")
+_SCB_NAME_RE = re.compile(r"((?:นาย|นาง|นางสาว)\s+[ก-๙\s]+?)\s+\d{3}-\d{6}-\d")
+# Honorific prefixes for a cheap find before _SCB_NAME_RE ("นางสาว" starts with "นาง")
+_SCB_HONORIFICS = ("นาย", "นาง")
+_SCB_BF_LITERAL = "BALANCE BROUGHT FORWARD"
+_SCB_BF_RE = re.compile(rf"{_SCB_BF_LITERAL}\)?\s*([\d,]+\.\d{{2}})")
+_SCB_CLOSING_RE = re.compile(
+    r"^\d{2}/\d{2}/\d{2}\s+\d{2}:\d{2}\s+X[12]\s+\w+\s+[\d,]+\.\d{2}\s+([\d,]+\.\d{2})",
+    re.MULTILINE,
+)
+# DD/MM/YY HH:MM X1/X2 Channel Amount Balance Description
+# Anchored per line and never crossing a newline, so it can scan a whole page.
+# Possessive quantifiers where the next token can't overlap, so near-miss
+# lines fail without backtracking.
+_SCB_TXN_RE = re.compile(
+    r"^(\d{2}/\d{2}/\d{2})[^\S\n]++"  # Date
+    r"(\d{2}:\d{2})[^\S\n]++"  # Time
+    r"(X[12])[^\S\n]++"  # Code (X1=credit, X2=debit)
+    r"(\w++)[^\S\n]++"  # Channel
+    r"([\d,]++\.\d{2})[^\S\n]++"  # Amount
+    r"([\d,]++\.\d{2})[^\S\n]+"  # Balance
+    r"(.++)$",  # Description
+    re.MULTILINE,
+)
+
 
 def extract_account_info_scb(
     text: str,
@@ -611,34 +780,47 @@ def extract_account_info_scb(
     currency = "THB"
 
     # Branch pattern: "XXX BRANCH" but not the bank name header
-    branch_match = re.search(r"^([A-Z][A-Z ]+BRANCH)$", text, re.MULTILINE)
+    # Only run the multiline regex when the literal is there at all
+    branch_match = _SCB_BRANCH_RE.search(text) if "BRANCH" in text else None
     if branch_match and "COMMERCIAL" not in branch_match.group(1):
         branch = branch_match.group(1).strip()
 
     # Account number pattern: XXX-XXXXXX-X (SCB format)
-    acc_match = re.search(r"(\d{3}-\d{6}-\d)", text)
+    acc_match = _SCB_ACC_RE.search(text)
     if acc_match:
         account_number = acc_match.group(1)
 
     # Period pattern: DD/MM/YYYY - DD/MM/YYYY
-    period_match = re.search(
-        r"(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})",
-        text,
-    )
+    period_match = _SCB_PERIOD_RE.search(text)
     if period_match:
         start_parts = period_match.group(1).split("/")
         end_parts = period_match.group(2).split("/")
         period_start = date(int(start_parts[2]), int(start_parts[1]), int(start_parts[0]))
         period_end = date(int(end_parts[2]), int(end_parts[1]), int(end_parts[0]))
 
-    # Account name - Thai honorific + name before account number
-    name_match = re.search(r"((?:นาย|นาง|นางสาว)\s+[ก-๙\s]+?)\s+\d{3}-\d{6}-\d", text)
-    if name_match:
-        account_name = name_match.group(1).strip()
+    # Account name - Thai honorific + name before account number.
+    # Start the regex at the first honorific, and skip it if there is none.
+    honorific_positions = [pos for h in _SCB_HONORIFICS if (pos := text.find(h)) >= 0]
+    if honorific_positions:
+        name_match = _SCB_NAME_RE.search(text, min(honorific_positions))
+        if name_match:
+            account_name = name_match.group(1).strip()
 
     return account_number, account_name, period_start, period_end, branch, currency
 
 
+def _extract_opening_scb(text: str) -> Decimal | None:
+    """Extract the BALANCE BROUGHT FORWARD amount from SCB statement text."""
+    # Locate the literal with str.find, then match the amount right there
+    idx = text.find(_SCB_BF_LITERAL)
+    while idx >= 0:
+        bf_match = _SCB_BF_RE.match(text, idx)
+        if bf_match:
+            return _parse_amount_token(bf_match.group(1))
+        idx = text.find(_SCB_BF_LITERAL, idx + 1)
+    return None
+
+
 def extract_balances_scb(text: str) -> tuple[Decimal | None, Decimal | None]:
     """Extract opening and closing balances from SCB statement.
 
@@ -649,21 +831,11 @@ def extract_balances_scb(text: str) -> tuple[Decimal | None, Decimal | None]:
     Returns:
         (opening_balance, closing_balance)
     """
-    opening = None
+    opening = _extract_opening_scb(text)
     closing = None
 
-    # Opening balance - BALANCE BROUGHT FORWARD
-    bf_match = re.search(r"BALANCE BROUGHT FORWARD\)?\s*([\d,]+\.\d{2})", text)
-    if bf_match:
-        opening = parse_amount(bf_match.group(1))
-
-    # Closing balance - find last transaction balance
-    # SCB transactions have format: DD/MM/YY HH:MM X1/X2 Channel Amount Balance Description
-    txn_pattern = re.compile(
-        r"^\d{2}/\d{2}/\d{2}\s+\d{2}:\d{2}\s+X[12]\s+\w+\s+[\d,]+\.\d{2}\s+([\d,]+\.\d{2})",
-        re.MULTILINE,
-    )
-    matches = txn_pattern.findall(text)
+    # Closing balance - last transaction's balance
+    matches = _SCB_CLOSING_RE.findall(text)
     if matches:
         closing = parse_amount(matches[-1])
 
@@ -684,21 +856,14 @@ def parse_transaction_line_scb(line: str) -> Transaction | None:
     Returns:
         Transaction object or None
     """
-    # Pattern: DD/MM/YY HH:MM X1/X2 Channel Amount Balance Description
-    pattern = re.compile(
-        r"^(\d{2}/\d{2}/\d{2})\s+"  # Date
-        r"(\d{2}:\d{2})\s+"  # Time
-        r"(X[12])\s+"  # Code (X1=credit, X2=debit)
-        r"(\w+)\s+"  # Channel
-        r"([\d,]+\.\d{2})\s+"  # Amount
-        r"([\d,]+\.\d{2})\s+"  # Balance
-        r"(.+)$"  # Description
-    )
-
-    match = pattern.match(line)
+    match = _SCB_TXN_RE.match(line)
     if not match:
         return None
+    return _build_txn_scb(match)
+
 
+def _build_txn_scb(match: re.Match[str]) -> Transaction | None:
+    """Build a Transaction from a _SCB_TXN_RE match."""
     date_str = match.group(1)
     time_str = match.group(2)
     code = match.group(3)
@@ -709,9 +874,7 @@ def parse_transaction_line_scb(line: str) -> Transaction | None:
 
     # Parse date (DD/MM/YY format)
     try:
-        day, month, year = date_str.split("/")
-        full_year = 2000 + int(year)
-        txn_date = date(full_year, int(month), int(day))
+        txn_date = _parse_ddmmyy(date_str)
     except Exception:
         return None
 
@@ -722,8 +885,8 @@ def parse_transaction_line_scb(line: str) -> Transaction | None:
     except Exception:
         txn_time = None
 
-    amount = parse_amount(amount_str)
-    balance = parse_amount(balance_str)
+    amount = _parse_amount_token(amount_str)
+    balance = _parse_amount_token(balance_str)
 
     # X1 = Credit (deposit), X2 = Debit (withdrawal)
     if code == "X1":
@@ -746,9 +909,96 @@ def parse_transaction_line_scb(line: str) -> Transaction | None:
     )
 
 
+def _extract_account_info_kbank(
+    text: str,
+) -> tuple[str | None, str | None, date | None, date | None, str | None, str | None]:
+    """extract_account_info with the branch/currency fields of the other banks."""
+    return (*extract_account_info(text), None, "THB")
+
+
+# Bank-specific extractors and line parsers, looked up once per PDF
+_ACCOUNT_EXTRACTORS = {
+    BANK_KBANK: _extract_account_info_kbank,
+    BANK_BBL: extract_account_info_bbl,
+    BANK_SCB: extract_account_info_scb,
+}
+_BALANCE_EXTRACTORS = {
+    BANK_KBANK: extract_balances,
+    BANK_BBL: extract_balances_bbl,
+    BANK_SCB: extract_balances_scb,
+}
+_LINE_PARSERS = {
+    BANK_KBANK: parse_transaction_line,
+    BANK_BBL: parse_transaction_line_bbl,
+    BANK_SCB: parse_transaction_line_scb,
+}
+
+
+def _looks_like_txn(line: str) -> bool:
+    """Cheap check that a line starts with a DD-MM-YY or DD/MM/YY date.
+
+    Lets parse_pdf skip headers, totals and blank lines before running
+    the bank-specific transaction regex.
+    """
+    sep = line[2:3]
+    return (sep == "/" or sep == "-") and line[5:6] == sep and line[:2].isdigit()
+
+
+def _extract_page_texts(pdf_path: Path, password: str) -> list[str]:
+    """Decrypt a PDF and extract each page's text once.
+
+    The decrypted copy is written to a private temp file (mode 0600) and
+    opened from disk, rather than held in memory as bytes plus a BytesIO
+    copy for the whole parse.
+    """
+    fd, decrypted_path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    try:
+        try:
+            with pikepdf.open(pdf_path, password=password) as pdf:
+                pdf.save(decrypted_path)
+            pdf_file = decrypted_path
+        except pikepdf.PasswordError:
+            # Try without password (might be unencrypted)
+            pdf_file = str(pdf_path)
+
+        with _open_pdf(pdf_file) as pdf:
+            return [page.extract_text() or "" for page in pdf.pages]
+    finally:
+        os.unlink(decrypted_path)
+
+
+def _extract_page_texts_from_bytes(data: bytes, password: str) -> list[str]:
+    """Decrypt in-memory PDF bytes and extract each page's text once."""
+    try:
+        with pikepdf.open(io.BytesIO(data), password=password) as pdf:
+            pdf_file = io.BytesIO()
+            pdf.save(pdf_file)
+    except pikepdf.PasswordError:
+        # Try without password (might be unencrypted)
+        pdf_file = io.BytesIO(data)
+
+    with _open_pdf(pdf_file) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def _password_opens(pdf: Path | io.BytesIO, password: str | None) -> bool:
+    """Check that password opens the PDF (always true when unencrypted).
+
+    Cache entries hold decrypted data, so they are only served to callers
+    that could have decrypted the PDF themselves.
+    """
+    try:
+        with pikepdf.open(pdf, password=password or ""):
+            return True
+    except pikepdf.PdfError:
+        return False
+
+
 def parse_pdf(
     pdf_path: Path | str,
     password: str = DEFAULT_PASSWORD,
+    cache_dir: Path | str | None = None,
 ) -> Statement:
     """Parse a bank PDF statement (KBank, BBL, or SCB).
 
@@ -757,82 +1007,137 @@ def parse_pdf(
     Args:
         pdf_path: Path to PDF file
         password: PDF password for decryption
+        cache_dir: Directory for caching parsed statements and extracted
+            page text between runs (default: no cache). Cache entries hold
+            decrypted data; they are only used once the password has been
+            checked against the PDF.
 
     Returns:
         Statement object with all extracted data
     """
     pdf_path = Path(pdf_path)
 
-    # Decrypt PDF
-    try:
-        pdf_bytes = decrypt_pdf(pdf_path, password)
-        pdf_file = io.BytesIO(pdf_bytes)
-    except pikepdf.PasswordError:
-        # Try without password (might be unencrypted)
-        pdf_file = str(pdf_path)
+    if cache_dir is None or not _password_opens(pdf_path, password):
+        # A wrong password skips the cache and fails as an uncached parse would
+        return _parse_page_texts(str(pdf_path), _extract_page_texts(pdf_path, password))
+
+    # Parsed statements are keyed by content, so a PDF downloaded again
+    # to a new location still hits
+    backend = _active_backend()
+    stmt_key = statement_key(pdf_path, backend)
+    statement = load_statement(cache_dir, stmt_key)
+    if statement is not None:
+        statement.source_pdf = str(pdf_path)
+        return statement
+
+    texts_key = page_texts_key(pdf_path, backend)
+    page_texts = load_page_texts(cache_dir, texts_key)
+    if page_texts is None:
+        page_texts = _extract_page_texts(pdf_path, password)
+        save_page_texts(cache_dir, texts_key, page_texts)
+
+    statement = _parse_page_texts(str(pdf_path), page_texts)
+    save_statement(cache_dir, stmt_key, statement)
+    return statement
+
+
+def parse_pdf_bytes(
+    data: bytes,
+    source_pdf: str,
+    password: str = DEFAULT_PASSWORD,
+    cache_dir: Path | str | None = None,
+) -> Statement:
+    """Parse a bank PDF statement held in memory.
+
+    Like parse_pdf, but for PDF content that was never written to disk
+    (e.g. an email attachment). Only parsed statements are cached; the
+    page text cache needs a file to fingerprint.
+
+    Args:
+        data: PDF file content
+        source_pdf: Name recorded as the statement's source_pdf
+        password: PDF password for decryption
+        cache_dir: Directory for caching parsed statements between runs
+            (default: no cache; see parse_pdf)
+
+    Returns:
+        Statement object with all extracted data
+    """
+    if cache_dir is None or not _password_opens(io.BytesIO(data), password):
+        return _parse_page_texts(source_pdf, _extract_page_texts_from_bytes(data, password))
+
+    stmt_key = statement_key(data, _active_backend())
+    statement = load_statement(cache_dir, stmt_key)
+    if statement is not None:
+        statement.source_pdf = source_pdf
+        return statement
+
+    statement = _parse_page_texts(source_pdf, _extract_page_texts_from_bytes(data, password))
+    save_statement(cache_dir, stmt_key, statement)
+    return statement
 
+
+def _parse_page_texts(source_pdf: str, page_texts: list[str]) -> Statement:
+    """Build a Statement from the extracted text of each page."""
     # Extract all text first for header info
     all_text = ""
     transactions: list[Transaction] = []
 
-    # Initialize bank-specific fields
-    branch = None
-    currency = "THB"
-
-    with pdfplumber.open(pdf_file) as pdf:
-        # Get full text first for bank detection
-        full_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-
-        # Detect bank type
-        bank_type = detect_bank_type(full_text)
-
-        # Get header info from first page
-        if pdf.pages:
-            first_page_text = pdf.pages[0].extract_text() or ""
-            all_text = first_page_text
-
-        # Extract account info based on bank type
-        if bank_type == BANK_BBL:
-            (
-                account_number,
-                account_name,
-                period_start,
-                period_end,
-                branch,
-                currency,
-            ) = extract_account_info_bbl(all_text)
-            opening_balance, closing_balance = extract_balances_bbl(full_text)
-        elif bank_type == BANK_SCB:
-            (
-                account_number,
-                account_name,
-                period_start,
-                period_end,
-                branch,
-                currency,
-            ) = extract_account_info_scb(all_text)
-            opening_balance, closing_balance = extract_balances_scb(full_text)
-        else:
-            account_number, account_name, period_start, period_end = extract_account_info(all_text)
-            opening_balance, closing_balance = extract_balances(full_text)
-
-        # Detect language
-        language = detect_pdf_language(full_text)
-
-        # Parse transactions from all pages using bank-specific parser
-        for page in pdf.pages:
-            page_text = page.extract_text() or ""
-            lines = page_text.split("\n")
-
-            for line in lines:
-                if bank_type == BANK_BBL:
-                    txn = parse_transaction_line_bbl(line)
-                elif bank_type == BANK_SCB:
-                    txn = parse_transaction_line_scb(line)
-                else:
-                    txn = parse_transaction_line(line)
+    # Get header info from first page
+    if page_texts:
+        all_text = page_texts[0]
+
+    # Detect bank type from the first page, where the bank name is printed;
+    # later pages only add transaction text that can mention other banks
+    bank_type = detect_bank_type(all_text)
+
+    full_text = "\n".join(page_texts)
+
+    # Extract account info based on bank type
+    (
+        account_number,
+        account_name,
+        period_start,
+        period_end,
+        branch,
+        currency,
+    ) = _ACCOUNT_EXTRACTORS[bank_type](all_text)
+    if bank_type == BANK_SCB:
+        # Closing comes from the parsed transactions below
+        opening_balance, closing_balance = _extract_opening_scb(full_text), None
+    else:
+        opening_balance, closing_balance = _BALANCE_EXTRACTORS[bank_type](full_text)
+
+    # Detect language
+    language = detect_pdf_language(full_text)
+
+    # Parse transactions from all pages using bank-specific parser
+    line_parser = _LINE_PARSERS[bank_type]
+    for page_text in page_texts:
+        if bank_type == BANK_SCB:
+            # One scan per page instead of one match per line
+            for match in _SCB_TXN_RE.finditer(page_text):
+                txn = _build_txn_scb(match)
                 if txn:
                     transactions.append(txn)
+            continue
+
+        lines = page_text.split("\n")
+
+        for line in lines:
+            if not _looks_like_txn(line):
+                continue
+            txn = line_parser(line)
+            if txn:
+                transactions.append(txn)
+
+    # SCB closing balance is the last transaction's balance; rescan the
+    # text only when no transaction line parsed
+    if bank_type == BANK_SCB:
+        if transactions:
+            closing_balance = transactions[-1].balance
+        else:
+            _, closing_balance = extract_balances_scb(full_text)
 
     # Create statement
     stmt_account = account_number or "UNKNOWN"
@@ -847,7 +1152,7 @@ def parse_pdf(
         opening_balance=opening_balance or Decimal("0"),
         closing_balance=closing_balance or Decimal("0"),
         transactions=transactions,
-        source_pdf=str(pdf_path),
+        source_pdf=source_pdf,
         language=language,
         bank=bank_type,
         branch=branch,
@@ -855,31 +1160,83 @@ def parse_pdf(
     )
 
 
+# With max_workers=None, smaller directories are parsed serially: starting
+# worker processes costs more than it saves for a handful of PDFs
+MIN_PARALLEL_PDFS = 4
+
+
+def _parse_pdf_or_none(
+    pdf_path: Path,
+    password: str,
+    cache_dir: Path | str | None = None,
+) -> Statement | None:
+    """Parse one PDF, returning None if it can't be parsed."""
+    try:
+        return parse_pdf(pdf_path, password, cache_dir)
+    except Exception:
+        return None
+
+
 def parse_all_pdfs(
     download_dir: Path | str,
     password: str = DEFAULT_PASSWORD,
+    max_workers: int | None = 1,
+    cache_dir: Path | str | None = None,
 ) -> list[Statement]:
     """Parse all PDFs in a directory.
 
+    PDFs are parsed one after another by default. Pass max_workers to
+    parse them in parallel worker processes instead; never more workers
+    than PDFs are started. Files that can't be parsed are skipped.
+
     Args:
         download_dir: Directory containing PDFs
         password: PDF password
+        max_workers: Number of worker processes (default: 1 = serial,
+            None = CPU count, or serial below MIN_PARALLEL_PDFS files)
+        cache_dir: Directory for caching parsed statements and extracted
+            page text between runs (default: no cache; see parse_pdf)
 
     Returns:
         List of Statement objects
     """
     download_dir = Path(download_dir)
-    statements: list[Statement] = []
-
-    # Match both .pdf and .PDF extensions
-    pdf_files = list(download_dir.glob("*.pdf")) + list(download_dir.glob("*.PDF"))
 
-    for pdf_path in pdf_files:
-        try:
-            statement = parse_pdf(pdf_path, password)
-            statements.append(statement)
-        except Exception:
-            # Skip files that can't be parsed
-            pass
+    # One directory pass, matching .pdf case-insensitively
+    try:
+        with os.scandir(download_dir) as entries:
+            pdf_files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith(".pdf") and entry.is_file()
+            )
+    except OSError:
+        # Missing or unreadable directory: nothing to parse, as with glob
+        return []
+
+    if max_workers is None:
+        if len(pdf_files) < MIN_PARALLEL_PDFS:
+            max_workers = 1
+        else:
+            max_workers = os.cpu_count() or 1
+    workers = min(max_workers, len(pdf_files))
 
-    return statements
+    if workers < 2:
+        results = [
+            _parse_pdf_or_none(pdf_path, password, cache_dir) for pdf_path in pdf_files
+        ]
+    else:
+        # Batch several PDFs per task to amortize pickling on large directories
+        chunksize = max(1, len(pdf_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _parse_pdf_or_none,
+                    pdf_files,
+                    repeat(password),
+                    repeat(cache_dir),
+                    chunksize=chunksize,
+                )
+            )
+
+    return [statement for statement in results if statement is not None]
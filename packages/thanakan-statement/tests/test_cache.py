@@ -0,0 +1,226 @@
+"""Tests for the on-disk parse cache."""
+
+import datetime as dt
+import os
+import stat
+from decimal import Decimal
+from unittest.mock import patch
+
+import pikepdf
+import pytest
+
+from thanakan_statement import Statement, parse_pdf, parse_pdf_bytes
+from thanakan_statement.cache import (
+    load_page_texts,
+    load_statement,
+    page_texts_key,
+    save_page_texts,
+    save_statement,
+    statement_key,
+)
+from thanakan_statement.parser import _active_backend
+
+
+@pytest.fixture
+def statement() -> Statement:
+    """Create a minimal parsed statement."""
+    return Statement(
+        account_number="123-4-56789-0",
+        statement_period_start=dt.date(2025, 11, 1),
+        statement_period_end=dt.date(2025, 11, 30),
+        opening_balance=Decimal("100.00"),
+        closing_balance=Decimal("100.00"),
+        source_pdf="old.pdf",
+        bank="kbank",
+    )
+
+
+@pytest.fixture
+def encrypted_pdf(tmp_path):
+    """Create a password-protected PDF."""
+    pdf_path = tmp_path / "encrypted.pdf"
+    pdf = pikepdf.Pdf.new()
+    pdf.add_blank_page(page_size=(612, 792))
+    pdf.save(pdf_path, encryption=pikepdf.Encryption(owner="owner123", user="user123"))
+    return pdf_path
+
+
+class TestCachePassword:
+    """Cached statements are only served when the password opens the PDF."""
+
+    def test_serves_cache_with_correct_password(self, tmp_path, encrypted_pdf, statement):
+        cache_dir = tmp_path / "cache"
+        save_statement(cache_dir, statement_key(encrypted_pdf, _active_backend()), statement)
+
+        result = parse_pdf(encrypted_pdf, password="user123", cache_dir=cache_dir)
+
+        assert result.account_number == statement.account_number
+        assert result.source_pdf == str(encrypted_pdf)
+
+    @pytest.mark.parametrize("password", ["wrongpass", "", None])
+    def test_skips_cache_with_wrong_password(self, tmp_path, encrypted_pdf, statement, password):
+        cache_dir = tmp_path / "cache"
+        save_statement(cache_dir, statement_key(encrypted_pdf, _active_backend()), statement)
+
+        # Falls through to a normal parse, which fails; the error type
+        # depends on the text extraction backend
+        with pytest.raises(Exception):
+            parse_pdf(encrypted_pdf, password=password, cache_dir=cache_dir)
+
+    def test_skips_cache_for_bytes_with_wrong_password(self, tmp_path, encrypted_pdf, statement):
+        cache_dir = tmp_path / "cache"
+        data = encrypted_pdf.read_bytes()
+        save_statement(cache_dir, statement_key(data, _active_backend()), statement)
+
+        assert parse_pdf_bytes(data, "a.pdf", password="user123", cache_dir=cache_dir) == (
+            statement.model_copy(update={"source_pdf": "a.pdf"})
+        )
+        with pytest.raises(Exception):
+            parse_pdf_bytes(data, "a.pdf", password="wrongpass", cache_dir=cache_dir)
+
+
+class TestPageTextsKey:
+    """The page text key changes whenever the extracted text could."""
+
+    def test_stable(self, tmp_path):
+        pdf_path = tmp_path / "a.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 one")
+        assert page_texts_key(pdf_path, "pypdfium2") == page_texts_key(pdf_path, "pypdfium2")
+
+    def test_content_change(self, tmp_path):
+        pdf_path = tmp_path / "a.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 one")
+        mtime_ns = pdf_path.stat().st_mtime_ns
+        key = page_texts_key(pdf_path, "pypdfium2")
+
+        # Same size and mtime, different bytes
+        pdf_path.write_bytes(b"%PDF-1.4 two")
+        os.utime(pdf_path, ns=(mtime_ns, mtime_ns))
+
+        assert page_texts_key(pdf_path, "pypdfium2") != key
+
+    def test_mtime_change(self, tmp_path):
+        pdf_path = tmp_path / "a.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 one")
+        key = page_texts_key(pdf_path, "pypdfium2")
+
+        mtime_ns = pdf_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(pdf_path, ns=(mtime_ns, mtime_ns))
+
+        assert page_texts_key(pdf_path, "pypdfium2") != key
+
+    def test_backend_change(self, tmp_path):
+        pdf_path = tmp_path / "a.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 one")
+        assert page_texts_key(pdf_path, "pypdfium2") != page_texts_key(pdf_path, "pdfplumber")
+
+
+class TestPageTextsEntries:
+    """Reading and writing cached page text."""
+
+    def test_round_trip(self, tmp_path):
+        save_page_texts(tmp_path, "key", ["หน้า 1", ""])
+        assert load_page_texts(tmp_path, "key") == ["หน้า 1", ""]
+
+    def test_missing(self, tmp_path):
+        assert load_page_texts(tmp_path / "missing", "key") is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"", b'["page one", "pa', b"\xff\xfe not json", b'{"pages": []}', b'"text"'],
+        ids=["empty", "truncated", "binary", "object", "string"],
+    )
+    def test_corrupt_entry(self, tmp_path, content):
+        (tmp_path / "key.json").write_bytes(content)
+        assert load_page_texts(tmp_path, "key") is None
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_owner_only_permissions(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        save_page_texts(cache_dir, "key", ["page"])
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        assert stat.S_IMODE((cache_dir / "key.json").stat().st_mode) == 0o600
+        assert [p.name for p in cache_dir.iterdir()] == ["key.json"]
+
+    def test_unwritable_cache_dir_ignored(self, tmp_path):
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("")
+        save_page_texts(not_a_dir, "key", ["page"])
+        assert load_page_texts(not_a_dir, "key") is None
+
+
+class TestStatementKey:
+    """The statement key follows the PDF content, package version and backend."""
+
+    def test_ignores_path_and_mtime(self, tmp_path):
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "copy" / "b.pdf"
+        second.parent.mkdir()
+        first.write_bytes(b"%PDF-1.4 one")
+        second.write_bytes(b"%PDF-1.4 one")
+        os.utime(second, ns=(0, 0))
+
+        key = statement_key(first, "pypdfium2")
+        assert statement_key(second, "pypdfium2") == key
+        assert statement_key(b"%PDF-1.4 one", "pypdfium2") == key
+
+    def test_content_change(self):
+        assert statement_key(b"%PDF-1.4 one", "pypdfium2") != statement_key(
+            b"%PDF-1.4 two", "pypdfium2"
+        )
+
+    def test_backend_change(self):
+        assert statement_key(b"%PDF-1.4 one", "pypdfium2") != statement_key(
+            b"%PDF-1.4 one", "pdfplumber"
+        )
+
+    def test_version_change(self):
+        with patch("thanakan_statement.cache._package_version", return_value="1.0.0"):
+            key = statement_key(b"%PDF-1.4 one", "pypdfium2")
+        with patch("thanakan_statement.cache._package_version", return_value="1.0.1"):
+            assert statement_key(b"%PDF-1.4 one", "pypdfium2") != key
+
+
+class TestStatementEntries:
+    """Reading and writing cached statements."""
+
+    def test_round_trip(self, tmp_path, statement):
+        save_statement(tmp_path, "key", statement)
+        assert load_statement(tmp_path, "key") == statement
+
+    def test_missing(self, tmp_path):
+        assert load_statement(tmp_path, "key") is None
+
+    def test_corrupt_entry(self, tmp_path, statement):
+        for content in (b"", b"\xff\xfe", b"[]", statement.model_dump_json().encode()[:40]):
+            (tmp_path / "key.json").write_bytes(content)
+            assert load_statement(tmp_path, "key") is None
+
+    def test_partial_entry(self, tmp_path, statement):
+        """An entry missing required fields (e.g. older schema) is a miss."""
+        data = statement.model_dump_json(exclude={"closing_balance"})
+        (tmp_path / "key.json").write_text(data, encoding="utf-8")
+        assert load_statement(tmp_path, "key") is None
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_owner_only_permissions(self, tmp_path, statement):
+        cache_dir = tmp_path / "cache"
+        save_statement(cache_dir, "key", statement)
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        assert stat.S_IMODE((cache_dir / "key.json").stat().st_mode) == 0o600
+
+    def test_corrupt_entry_reparsed(self, tmp_path, encrypted_pdf, statement):
+        """parse_pdf falls back to a real parse when the entry is unreadable."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        key = statement_key(encrypted_pdf, _active_backend())
+        (cache_dir / f"{key}.json").write_text("{", encoding="utf-8")
+
+        with patch("thanakan_statement.parser._parse_page_texts", return_value=statement) as parse:
+            parse_pdf(encrypted_pdf, password="user123", cache_dir=cache_dir)
+
+        parse.assert_called_once()
+        # The bad entry is replaced by the fresh parse
+        assert load_statement(cache_dir, key) == statement
@@ -0,0 +1,125 @@
+"""Tests for statement exporters."""
+
+import csv
+import datetime as dt
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from thanakan_statement import Account, Statement, Transaction, export_to_csv, export_to_json
+
+
+def _account(account_number: str, description: str = "Transfer") -> Account:
+    return Account(
+        account_number=account_number,
+        all_transactions=[
+            Transaction(
+                date=dt.date(2025, 11, 1),
+                description=description,
+                withdrawal=Decimal("10.00"),
+                balance=Decimal("90.00"),
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def accounts() -> list[Account]:
+    """Two accounts with one transaction each."""
+    return [_account("123-4-56789-0"), _account("987-6-54321-0")]
+
+
+class TestExportToCsv:
+    """Tests for export_to_csv."""
+
+    def test_serial_by_default(self, tmp_path, accounts):
+        """Should not start a process pool unless asked to."""
+        with patch("thanakan_statement.export.ProcessPoolExecutor") as pool:
+            export_to_csv(accounts, tmp_path)
+
+        pool.assert_not_called()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["1234567890.csv", "9876543210.csv"]
+
+    def test_parallel_when_requested(self, tmp_path, accounts):
+        """Should write the same files from worker processes."""
+        export_to_csv(accounts, tmp_path, max_workers=2)
+
+        with open(tmp_path / "1234567890.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[1][2] == "Transfer"
+        assert (tmp_path / "9876543210.csv").exists()
+
+    def test_workers_capped_at_account_count(self, tmp_path, accounts):
+        with (
+            patch("thanakan_statement.export.os.cpu_count", return_value=8),
+            patch("thanakan_statement.export.ProcessPoolExecutor") as pool,
+        ):
+            export_to_csv(accounts, tmp_path, max_workers=None)
+
+        pool.assert_called_once_with(max_workers=2)
+
+    def test_shared_account_number_written_serially(self, tmp_path):
+        """Accounts mapping to the same file should not race; the last wins."""
+        accounts = [_account("123-4-56789-0", "first"), _account("1234567890", "second")]
+
+        with patch("thanakan_statement.export.ProcessPoolExecutor") as pool:
+            export_to_csv(accounts, tmp_path, max_workers=None)
+
+        pool.assert_not_called()
+        with open(tmp_path / "1234567890.csv", newline="", encoding="utf-8") as f:
+            assert list(csv.reader(f))[1][2] == "second"
+
+
+class TestExportToJson:
+    """Tests for export_to_json."""
+
+    def test_matches_model_dump(self, tmp_path):
+        """Streamed output should load back to the same data as model_dump."""
+        txn = Transaction(
+            date=dt.date(2025, 11, 2),
+            time=dt.time(9, 30),
+            description="รับโอนเงิน \"quoted\"",
+            channel="K PLUS",
+            deposit=Decimal("1234.50"),
+            balance=Decimal("1324.50"),
+            reference="REF1",
+        )
+        statement = Statement(
+            account_number="123-4-56789-0",
+            statement_period_start=dt.date(2025, 11, 1),
+            statement_period_end=dt.date(2025, 11, 30),
+            opening_balance=Decimal("100.00"),
+            closing_balance=Decimal("1324.50"),
+            transactions=[txn],
+            source_pdf="nov.pdf",
+        )
+        accounts = [
+            Account(
+                account_number="123-4-56789-0",
+                account_name="นาย ทดสอบ",
+                statements=[statement],
+                all_transactions=[*_account("123-4-56789-0").all_transactions, txn],
+            ),
+            Account(account_number="987-6-54321-0"),
+        ]
+        output = tmp_path / "out.json"
+
+        export_to_json(accounts, output)
+
+        with open(output, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data == [account.model_dump(mode="json") for account in accounts]
+
+    def test_writes_utf8(self, tmp_path):
+        """Thai text should be written as UTF-8, not \\u escapes."""
+        output = tmp_path / "out.json"
+        export_to_json([_account("123-4-56789-0", "โอนเงิน")], output)
+        assert "โอนเงิน".encode() in output.read_bytes()
+
+    def test_empty(self, tmp_path):
+        output = tmp_path / "out.json"
+        export_to_json([], output)
+        with open(output, encoding="utf-8") as f:
+            assert json.load(f) == []
@@ -0,0 +1,89 @@
+"""Tests for statement models."""
+
+import datetime as dt
+import os
+import subprocess
+import sys
+from decimal import Decimal
+
+from thanakan_statement import Account, Statement, Transaction
+
+
+def _txn(description: str, balance: str, day: int = 1, **kwargs) -> Transaction:
+    return Transaction(
+        date=dt.date(2025, 11, day),
+        description=description,
+        withdrawal=Decimal("1.00"),
+        balance=Decimal(balance),
+        **kwargs,
+    )
+
+
+def _statement(transactions: list[Transaction], source: str = "a.pdf") -> Statement:
+    return Statement(
+        account_number="123-4-56789-0",
+        statement_period_start=dt.date(2025, 11, 1),
+        statement_period_end=dt.date(2025, 11, 30),
+        opening_balance=Decimal("100.00"),
+        closing_balance=Decimal("94.00"),
+        transactions=transactions,
+        source_pdf=source,
+    )
+
+
+class TestMergeTransactions:
+    """Tests for Account transaction merging."""
+
+    def test_keeps_document_order_for_same_day(self):
+        """Same-day rows without a time should stay in document order."""
+        txns = [_txn(f"row {i}", str(99 - i)) for i in range(6)]
+        account = Account(account_number="123-4-56789-0")
+
+        account.add_statement(_statement(txns))
+
+        assert [t.description for t in account.all_transactions] == [
+            f"row {i}" for i in range(6)
+        ]
+
+    def test_removes_duplicates_across_statements(self):
+        """Overlapping statements should contribute each transaction once."""
+        first = [_txn("a", "99"), _txn("b", "98"), _txn("c", "97", day=2)]
+        second = [_txn("b", "98"), _txn("c", "97", day=2), _txn("d", "96", day=3)]
+        account = Account(account_number="123-4-56789-0")
+
+        account.add_statement(_statement(first, "a.pdf"))
+        account.add_statement(_statement(second, "b.pdf"))
+
+        assert [t.description for t in account.all_transactions] == ["a", "b", "c", "d"]
+
+    def test_order_does_not_depend_on_hash_seed(self):
+        """Merged order should be the same under every PYTHONHASHSEED."""
+        code = (
+            "import datetime as dt\n"
+            "from decimal import Decimal\n"
+            "from thanakan_statement import Account, Statement, Transaction\n"
+            "txns = [Transaction(date=dt.date(2025, 11, 1), description=f'row {i}',"
+            " withdrawal=Decimal('1.00'), balance=Decimal(99 - i)) for i in range(6)]\n"
+            "stmt = Statement(account_number='1', statement_period_start=dt.date(2025, 11, 1),"
+            " statement_period_end=dt.date(2025, 11, 30), opening_balance=Decimal(100),"
+            " closing_balance=Decimal(94), transactions=txns, source_pdf='a.pdf')\n"
+            "account = Account(account_number='1')\n"
+            "account.add_statement(stmt)\n"
+            "print([t.description for t in account.all_transactions])\n"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout
+            for seed in ("1", "2", "3")
+        }
+
+        assert len(outputs) == 1
+
+    def test_equality_uses_all_fields(self):
+        """Transactions differing only in reference should not be equal."""
+        assert _txn("a", "99", reference="X") != _txn("a", "99", reference="Y")
@@ -0,0 +1,155 @@
+"""Tests for PDF statement parsing."""
+
+import re
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from thanakan_statement import parse_all_pdfs
+from thanakan_statement.parser import (
+    MIN_PARALLEL_PDFS,
+    _SCB_TXN_RE,
+    _build_txn_scb,
+    extract_balances_scb,
+    parse_transaction_line_scb,
+)
+
+SCB_TEXT = """UDON THANI BRANCH
+ยอดเงินคงเหลือยกมา (BALANCE BROUGHT FORWARD) 45,542.00
+01/04/24 19:20 X2 ENET 3,470.00 42,072.00 PromptPay x9119 นาย วรพงษ์
+02/04/24 08:05 X1 ATM 1,000.00 43,072.00 รับโอนเงิน
+"""
+
+# Line-by-line SCB pattern from before the page-wide scan
+_LINE_SCB_TXN_RE = re.compile(
+    r"^(\d{2}/\d{2}/\d{2})\s+"
+    r"(\d{2}:\d{2})\s+"
+    r"(X[12])\s+"
+    r"(\w+)\s+"
+    r"([\d,]+\.\d{2})\s+"
+    r"([\d,]+\.\d{2})\s+"
+    r"(.+)$"
+)
+
+SCB_PAGE = "\n".join([
+    "ยอดเงินคงเหลือยกมา (BALANCE BROUGHT FORWARD) 45,542.00",
+    "01/04/24 19:20 X2 ENET 3,470.00 42,072.00 PromptPay x9119 นาย วรพงษ์",
+    "01/04/24  19:25\tX1   ATM 500.00 42,572.00 ฝากเงิน  ",
+    "01/04/24 19:30 X3 ENET 1.00 42,571.00 bad code",
+    "01/04/24 19:31 X2 ENET 1.00 42,571.00",
+    "01/04/24 19:32 X2 ENET 1.00",
+    "42,571.00 continuation line",
+    "   02/04/24 08:05 X1 ATM 1,000.00 43,572.00 leading spaces",
+    "31/13/24 08:05 X1 ATM 1,000.00 43,572.00 bad date",
+    "02/04/24 08:10 X2 BR0369 12,345,678.90 1.00 large amount",
+    "",
+])
+
+
+class TestScbPageScan:
+    """The page-wide SCB scan finds the same transactions as line matching."""
+
+    def test_same_matches_as_line_by_line(self):
+        page_matches = [m.groups() for m in _SCB_TXN_RE.finditer(SCB_PAGE)]
+        line_matches = [
+            m.groups() for line in SCB_PAGE.split("\n") if (m := _LINE_SCB_TXN_RE.match(line))
+        ]
+        assert page_matches == line_matches
+        assert len(page_matches) == 4
+
+    def test_same_transactions_as_line_parser(self):
+        from_page = [
+            txn for m in _SCB_TXN_RE.finditer(SCB_PAGE) if (txn := _build_txn_scb(m))
+        ]
+        from_lines = [
+            txn for line in SCB_PAGE.split("\n") if (txn := parse_transaction_line_scb(line))
+        ]
+        assert from_page == from_lines
+        # The impossible date is dropped by both
+        assert [t.description for t in from_page] == [
+            "PromptPay x9119 นาย วรพงษ์",
+            "ฝากเงิน",
+            "large amount",
+        ]
+
+    @pytest.mark.parametrize("text", ["", "no transactions here", "01/04/24 19:20 X2"])
+    def test_no_matches(self, text):
+        assert list(_SCB_TXN_RE.finditer(text)) == []
+
+
+class TestExtractBalancesScb:
+    """Tests for extract_balances_scb."""
+
+    def test_opening_and_closing(self):
+        """Should read the brought-forward amount and the last balance."""
+        assert extract_balances_scb(SCB_TEXT) == (Decimal("45542.00"), Decimal("43072.00"))
+
+    def test_no_transactions(self):
+        assert extract_balances_scb("BALANCE BROUGHT FORWARD 10.00") == (Decimal("10.00"), None)
+
+
+class TestParseAllPdfs:
+    """Tests for parse_all_pdfs."""
+
+    def test_serial_by_default(self, tmp_path):
+        """Should parse in-process unless max_workers is given."""
+        for name in ("a.pdf", "b.PDF", "notes.txt"):
+            (tmp_path / name).write_bytes(b"not a pdf")
+
+        with (
+            patch("thanakan_statement.parser.ProcessPoolExecutor") as pool,
+            patch("thanakan_statement.parser._parse_pdf_or_none", return_value=None) as parse,
+        ):
+            assert parse_all_pdfs(tmp_path, password="x") == []
+
+        pool.assert_not_called()
+        assert [call.args[0].name for call in parse.call_args_list] == ["a.pdf", "b.PDF"]
+
+    def test_parallel_when_requested(self, tmp_path):
+        """Should hand the files to a process pool when max_workers is set."""
+        for name in ("a.pdf", "b.pdf"):
+            (tmp_path / name).write_bytes(b"not a pdf")
+
+        with patch("thanakan_statement.parser.ProcessPoolExecutor") as pool:
+            pool.return_value.__enter__.return_value.map.return_value = [None, None]
+            assert parse_all_pdfs(tmp_path, password="x", max_workers=2) == []
+
+        pool.assert_called_once_with(max_workers=2)
+
+    def test_workers_capped_at_file_count(self, tmp_path):
+        """Should never start more workers than there are PDFs."""
+        for name in ("a.pdf", "b.pdf"):
+            (tmp_path / name).write_bytes(b"not a pdf")
+
+        with patch("thanakan_statement.parser.ProcessPoolExecutor") as pool:
+            pool.return_value.__enter__.return_value.map.return_value = [None, None]
+            parse_all_pdfs(tmp_path, password="x", max_workers=16)
+
+        pool.assert_called_once_with(max_workers=2)
+
+    def test_cpu_count_serial_for_few_files(self, tmp_path):
+        """max_workers=None should not start a pool for a handful of PDFs."""
+        for i in range(MIN_PARALLEL_PDFS - 1):
+            (tmp_path / f"{i}.pdf").write_bytes(b"not a pdf")
+
+        with patch("thanakan_statement.parser.ProcessPoolExecutor") as pool:
+            assert parse_all_pdfs(tmp_path, password="x", max_workers=None) == []
+
+        pool.assert_not_called()
+
+    def test_cpu_count_parallel_for_many_files(self, tmp_path):
+        for i in range(MIN_PARALLEL_PDFS):
+            (tmp_path / f"{i}.pdf").write_bytes(b"not a pdf")
+
+        with (
+            patch("thanakan_statement.parser.os.cpu_count", return_value=2),
+            patch("thanakan_statement.parser.ProcessPoolExecutor") as pool,
+        ):
+            pool.return_value.__enter__.return_value.map.return_value = []
+            parse_all_pdfs(tmp_path, password="x", max_workers=None)
+
+        pool.assert_called_once_with(max_workers=2)
+
+    def test_missing_directory(self, tmp_path):
+        assert parse_all_pdfs(tmp_path / "missing") == []
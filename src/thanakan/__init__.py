@@ -1,10 +1,34 @@
 """Thanakan v2 - Thai bank utilities"""
 
+import importlib
+
 __version__ = "2.0.0"
 
-# Re-export from sub-libraries
-from thanakan_qr import SlipQRData, QrPayload, not_bank_slip, expect_single_qrcode
-from thanakan_oauth import KBankAPI, SCBAPI, SCBBaseURL
+# Re-export from sub-libraries, imported on first access so the CLI and
+# `import thanakan` don't load zbar/PIL or the OAuth clients up front
+_LAZY_EXPORTS = {
+    "SlipQRData": "thanakan_qr",
+    "QrPayload": "thanakan_qr",
+    "not_bank_slip": "thanakan_qr",
+    "expect_single_qrcode": "thanakan_qr",
+    "KBankAPI": "thanakan_oauth",
+    "SCBAPI": "thanakan_oauth",
+    "SCBBaseURL": "thanakan_oauth",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     "SlipQRData",
@@ -14,19 +14,22 @@ app = typer.Typer(
 )
 
 
+# Image signatures keyed by first byte: (offset, magic) checks that must all match
+_IMAGE_MAGIC: dict[int, tuple[tuple[int, bytes], ...]] = {
+    0x89: ((0, b"\x89PNG"),),  # PNG
+    0xFF: ((0, b"\xff\xd8\xff"),),  # JPEG
+    0x47: ((0, b"GIF8"),),  # GIF
+    0x52: ((0, b"RIFF"), (8, b"WEBP")),  # WebP
+    0x42: ((0, b"BM"),),  # BMP
+}
+
+
 def _is_image_data(data: bytes) -> bool:
     """Detect if data is an image based on magic bytes."""
-    if data.startswith(b"\x89PNG"):  # PNG
-        return True
-    if data.startswith(b"\xff\xd8\xff"):  # JPEG
-        return True
-    if data.startswith(b"GIF8"):  # GIF
-        return True
-    if data.startswith(b"RIFF") and len(data) > 12 and data[8:12] == b"WEBP":
-        return True
-    if data.startswith(b"BM"):  # BMP
-        return True
-    return False
+    checks = _IMAGE_MAGIC.get(data[0]) if data else None
+    if checks is None:
+        return False
+    return all(data[offset:offset + len(magic)] == magic for offset, magic in checks)
 
 
 @app.command()
@@ -1,12 +1,14 @@
 """Thanakan CLI - Accounting software export commands"""
 
-import tempfile
+import os
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from thanakan.cli_enums import BankChoice, Language
+
 accounting_app = typer.Typer(
     name="accounting",
     help="Export bank statements to accounting software formats (Peak, etc.)",
@@ -14,20 +16,11 @@ accounting_app = typer.Typer(
 )
 
 
-class Language(str, Enum):
-    """Preferred language for statement selection."""
-
-    en = "en"
-    th = "th"
-
+class ExcelEngine(str, Enum):
+    """Excel writer engine for Peak export."""
 
-class BankChoice(str, Enum):
-    """Supported banks for email download."""
-
-    kbank = "kbank"
-    bbl = "bbl"
-    scb = "scb"
-    all = "all"
+    openpyxl = "openpyxl"
+    xlsxwriter = "xlsxwriter"
 
 
 @accounting_app.command()
@@ -73,6 +66,16 @@ def peak(
         "-l",
         help="Preferred language for overlapping statements",
     ),
+    engine: ExcelEngine = typer.Option(
+        ExcelEngine.openpyxl,
+        "--engine",
+        help="Excel writer (xlsxwriter is faster; needs the xlsxwriter extra)",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse parsed statements from the on-disk cache (stores decrypted data)",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -107,21 +110,31 @@ def peak(
     """
     try:
         from thanakan_statement import consolidate_by_account
+        from thanakan_statement.cache import DEFAULT_CACHE_DIR
         import thanakan_accounting  # noqa: F401
     except ImportError as e:
         typer.echo(f"Error: Missing dependency - {e}", err=True)
         typer.echo("Install with: uv sync", err=True)
         raise typer.Exit(1)
 
+    if engine == ExcelEngine.xlsxwriter:
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            typer.echo("Error: xlsxwriter is not installed", err=True)
+            typer.echo("Install with: pip install thanakan-accounting[xlsxwriter]", err=True)
+            raise typer.Exit(1)
+
     pwd = password
+    cache_dir = DEFAULT_CACHE_DIR if cache else None
 
     # Determine source: local path or email download
     if path is not None:
         # Use local PDF files
-        statements = _parse_local_pdfs(path, pwd, verbose)
+        statements = _parse_local_pdfs(path, pwd, verbose, cache_dir)
     else:
         # Download from email
-        statements = _download_and_parse(bank, since, until, pwd, verbose)
+        statements = _download_and_parse(bank, since, until, pwd, verbose, cache_dir)
 
     if not statements:
         typer.echo("No statements found", err=True)
@@ -145,29 +158,55 @@ def peak(
     # Export each selected account to separate file
     from thanakan_accounting import export_single_to_peak
 
+    # Create the output directory once instead of failing per account
+    parent, stem = output.parent, output.stem
+    parent.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        (acc, parent / f"{stem}_{acc.account_number.replace('-', '')}.xlsx")
+        for acc in selected_accounts
+    ]
+
     typer.echo("\nExported:", err=True)
-    for acc in selected_accounts:
-        acc_num = acc.account_number.replace("-", "")
-        out_file = output.parent / f"{output.stem}_{acc_num}.xlsx"
+    if len(jobs) == 1:
+        acc, out_file = jobs[0]
         try:
-            export_single_to_peak(acc, out_file)
+            export_single_to_peak(acc, out_file, engine=engine.value)
             typer.echo(f"  {out_file}", err=True)
         except Exception as e:
             typer.echo(f"  Error exporting {acc.account_number}: {e}", err=True)
+        return
+
+    # Each account is an independent file; write them in parallel processes
+    # and report each one as it finishes
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(export_single_to_peak, acc, out_file, engine=engine.value): (acc, out_file)
+            for acc, out_file in jobs
+        }
+        for future in as_completed(futures):
+            acc, out_file = futures[future]
+            try:
+                future.result()
+                typer.echo(f"  {out_file}", err=True)
+            except Exception as e:
+                typer.echo(f"  Error exporting {acc.account_number}: {e}", err=True)
 
 
 def _select_accounts(accounts):
     """Interactive TUI to select accounts for export."""
     import questionary
 
-    # Build choices for TUI
+    # Build choices for TUI, busiest accounts first
     choices = [
         questionary.Choice(
             title=f"{acc.account_number} ({len(acc.all_transactions)} txns)",
             value=acc,
             checked=True,  # default all selected
         )
-        for acc in accounts
+        for acc in sorted(accounts, key=lambda acc: len(acc.all_transactions), reverse=True)
     ]
 
     # Interactive TUI: spacebar to toggle, enter to confirm
@@ -179,7 +218,7 @@ def _select_accounts(accounts):
     return selected or []
 
 
-def _parse_local_pdfs(path: Path, password: str, verbose: bool):
+def _parse_local_pdfs(path: Path, password: str, verbose: bool, cache_dir: Path | None = None):
     """Parse PDFs from local path."""
     from thanakan_statement import parse_all_pdfs, parse_pdf
 
@@ -187,11 +226,11 @@ def _parse_local_pdfs(path: Path, password: str, verbose: bool):
         if path.is_file():
             if verbose:
                 typer.echo(f"Parsing: {path}", err=True)
-            return [parse_pdf(path, password=password)]
+            return [parse_pdf(path, password=password, cache_dir=cache_dir)]
         else:
             if verbose:
                 typer.echo(f"Scanning directory: {path}", err=True)
-            statements = parse_all_pdfs(path, password=password)
+            statements = parse_all_pdfs(path, password=password, max_workers=None, cache_dir=cache_dir)
             if verbose:
                 typer.echo(f"Parsed {len(statements)} statement(s)", err=True)
             return statements
@@ -200,12 +239,32 @@ def _parse_local_pdfs(path: Path, password: str, verbose: bool):
         raise typer.Exit(1)
 
 
+def _parse_downloaded(filename: str, data: bytes, password: str, cache_dir: Path | None = None):
+    """Parse a fetched PDF, decrypting it if needed (runs in a worker).
+
+    parse_pdf_bytes decrypts encrypted statements in memory, so nothing
+    is written to disk. With a cache_dir, statements seen on an earlier
+    run are loaded by content hash instead of parsed again.
+
+    Returns:
+        (statement, None) on success, (None, error message) on failure
+    """
+    from thanakan_statement import parse_pdf_bytes
+
+    try:
+        return parse_pdf_bytes(data, filename, password=password, cache_dir=cache_dir), None
+    except Exception as e:
+        # pdfminer's wrong-password error has an empty message
+        return None, str(e) or repr(e)
+
+
 def _download_and_parse(
     bank: BankChoice,
     since: str,
     until: str | None,
     password: str,
     verbose: bool,
+    cache_dir: Path | None = None,
 ):
     """Download statements from email and parse them."""
     try:
@@ -213,10 +272,8 @@ def _download_and_parse(
             GmailProvider,
             StatementDownloader,
             BANK_CONFIGS,
-            unlock_pdf,
-            is_pdf_encrypted,
         )
-        from thanakan_statement import parse_pdf
+        import thanakan_statement  # noqa: F401
     except ImportError as e:
         typer.echo(f"Error: Missing dependency - {e}", err=True)
         typer.echo("Install thanakan-mail and thanakan-statement", err=True)
@@ -242,56 +299,74 @@ def _download_and_parse(
             range_desc += f" until {until}"
         typer.echo(f"Downloading statements ({range_desc})...", err=True)
 
-    # Download to temp directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        all_pdf_paths: list[Path] = []
-
-        for bank_code in banks_to_process:
-            if verbose:
-                typer.echo(f"  Searching {bank_code.upper()}...", err=True)
-
-            bank_config = BANK_CONFIGS[bank_code]
-            downloader = StatementDownloader(provider, bank_config, tmpdir_path)
-            results = downloader.download_statements(
+    def fetch_bank(bank_code: str):
+        """Fetch one bank's statements; errors are returned, not raised."""
+        try:
+            downloader = StatementDownloader(provider, BANK_CONFIGS[bank_code])
+            results = downloader.fetch_statements(
                 max_emails=100,
                 since=since,
                 until=until,
                 verbose=False,
             )
+            return results, None
+        except Exception as e:
+            return None, e
+
+    # Fetch all banks concurrently into memory, handing each bank's PDFs
+    # to the parse workers as soon as they arrive so parsing overlaps the
+    # remaining downloads
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from contextlib import ExitStack
+
+    with ExitStack() as stack:
+        fetch_pool = stack.enter_context(ThreadPoolExecutor(max_workers=len(banks_to_process)))
+        # Worker processes are only started once there is a PDF to parse
+        executor = None
+        parse_jobs = []
+        if verbose:
+            for bank_code in banks_to_process:
+                typer.echo(f"  Searching {bank_code.upper()}...", err=True)
+
+        fetches = fetch_pool.map(fetch_bank, banks_to_process)
+        for bank_code, (results, error) in zip(banks_to_process, fetches):
+            if error is not None:
+                typer.echo(f"Error downloading from {bank_code}: {error}", err=True)
+                if verbose:
+                    import traceback
+
+                    typer.echo("".join(traceback.format_exception(error)), err=True)
+                continue
 
-            # Collect downloaded PDFs
+            # Start parsing fetched PDFs
+            pdfs_count = 0
             for r in results:
-                for filename in r.downloaded_files:
-                    all_pdf_paths.append(tmpdir_path / filename)
+                for filename, data in r.pdf_data.items():
+                    if executor is None:
+                        executor = stack.enter_context(ProcessPoolExecutor())
+                    future = executor.submit(_parse_downloaded, filename, data, password, cache_dir)
+                    parse_jobs.append((filename, future))
+                    pdfs_count += 1
 
-            pdfs_count = sum(len(r.downloaded_files) for r in results)
             if verbose:
-                typer.echo(f"    Found {pdfs_count} PDF(s)", err=True)
+                typer.echo(f"    {bank_code.upper()}: found {pdfs_count} PDF(s)", err=True)
 
-        if not all_pdf_paths:
+        if not parse_jobs:
             typer.echo("No PDFs found in email", err=True)
             return []
 
-        typer.echo(f"Downloaded {len(all_pdf_paths)} PDF(s) from email", err=True)
+        typer.echo(f"Downloaded {len(parse_jobs)} PDF(s) from email", err=True)
 
-        # Unlock and parse each PDF
+        # Collect parsed statements in download order
         statements = []
-        for pdf_path in all_pdf_paths:
-            try:
-                # Unlock if encrypted
-                if is_pdf_encrypted(pdf_path):
-                    unlocked_path = pdf_path.with_suffix(".unlocked.pdf")
-                    unlock_pdf(pdf_path, unlocked_path, password)
-                    pdf_path = unlocked_path
-
-                stmt = parse_pdf(pdf_path, password=password)
+        for filename, future in parse_jobs:
+            stmt, error = future.result()
+            if stmt is not None:
                 statements.append(stmt)
                 if verbose:
                     typer.echo(f"  Parsed: {stmt.account_number} ({stmt.bank})", err=True)
-            except Exception as e:
-                if verbose:
-                    typer.echo(f"  Failed to parse {pdf_path.name}: {e}", err=True)
+            elif verbose:
+                typer.echo(f"  Failed to parse {filename}: {error}", err=True)
 
         typer.echo(f"Parsed {len(statements)} statement(s)", err=True)
         return statements
@@ -0,0 +1,19 @@
+"""Thanakan CLI - Choice enums shared by the command modules"""
+
+from enum import Enum
+
+
+class BankChoice(str, Enum):
+    """Supported banks for email download."""
+
+    kbank = "kbank"
+    bbl = "bbl"
+    scb = "scb"
+    all = "all"
+
+
+class Language(str, Enum):
+    """Preferred language for statement selection."""
+
+    en = "en"
+    th = "th"
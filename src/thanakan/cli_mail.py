@@ -1,11 +1,14 @@
 """Thanakan CLI - Email download commands"""
 
+import os
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from thanakan.cli_enums import BankChoice
+
 mail_app = typer.Typer(
     name="mail",
     help="Download bank statement PDFs from email (Gmail)",
@@ -13,15 +16,6 @@ mail_app = typer.Typer(
 )
 
 
-class BankChoice(str, Enum):
-    """Supported banks."""
-
-    kbank = "kbank"
-    bbl = "bbl"
-    scb = "scb"
-    all = "all"
-
-
 class RememberChoice(str, Enum):
     """Password storage options."""
 
@@ -187,33 +181,49 @@ def download(
     # Download from each bank
     total_emails = 0
     total_pdfs = 0
-    all_pdf_paths: list[str] = []
-
-    for bank_code in banks_to_process:
-        if len(banks_to_process) > 1 or verbose:
-            typer.echo(f"\n{'='*50}")
-            typer.echo(f"Downloading from {bank_code.upper()}")
-            typer.echo("=" * 50)
 
+    def download_bank(bank_code: str):
+        """Download one bank's statements; errors are returned, not raised."""
         try:
-            bank_config = BANK_CONFIGS[bank_code]
-            downloader = StatementDownloader(provider, bank_config, output)
+            downloader = StatementDownloader(provider, BANK_CONFIGS[bank_code], output)
             results = downloader.download_statements(
                 max_emails=max_emails,
                 since=since,
                 until=until,
                 verbose=verbose,
             )
+            return results, None
+        except Exception as e:
+            return None, e
+
+    # Banks are independent Gmail queries, so run them concurrently. Verbose
+    # runs stay sequential (lazy map) so each bank's progress prints under
+    # its own header.
+    from concurrent.futures import ThreadPoolExecutor
+
+    concurrent = len(banks_to_process) > 1 and not verbose
+    with ThreadPoolExecutor(max_workers=len(banks_to_process)) as pool:
+        downloads = (pool.map if concurrent else map)(download_bank, banks_to_process)
+
+        for bank_code, (results, error) in zip(banks_to_process, downloads):
+            if len(banks_to_process) > 1 or verbose:
+                typer.echo(f"\n{'='*50}")
+                typer.echo(f"Downloading from {bank_code.upper()}")
+                typer.echo("=" * 50)
+
+            if error is not None:
+                typer.echo(f"Error downloading from {bank_code}: {error}", err=True)
+                if verbose:
+                    import traceback
+
+                    typer.echo("".join(traceback.format_exception(error)), err=True)
+                continue
 
             emails_count = len(results)
             pdfs_count = sum(len(r.downloaded_files) for r in results)
             total_emails += emails_count
             total_pdfs += pdfs_count
 
-            # Collect PDF paths for parsing
-            for r in results:
-                all_pdf_paths.extend(r.downloaded_files)
-
             typer.echo(f"{bank_code.upper()}: {pdfs_count} PDFs from {emails_count} emails")
 
             # Save metadata
@@ -223,13 +233,6 @@ def download(
                 if verbose:
                     typer.echo(f"  Metadata: {metadata_path}")
 
-        except Exception as e:
-            typer.echo(f"Error downloading from {bank_code}: {e}", err=True)
-            if verbose:
-                import traceback
-
-                typer.echo(traceback.format_exc(), err=True)
-
     # Summary
     typer.echo(f"\n{'='*50}")
     typer.echo(f"TOTAL: {total_pdfs} PDFs from {total_emails} emails")
@@ -237,7 +240,7 @@ def download(
     typer.echo("=" * 50)
 
     # Optional: Parse PDFs inline
-    if parse and all_pdf_paths:
+    if parse and total_pdfs:
         typer.echo("\nParsing downloaded PDFs...")
 
         # Get password for parsing
@@ -288,7 +291,7 @@ def _parse_pdfs(directory: Path, password: Optional[str], verbose: bool) -> None
         return
 
     try:
-        statements = parse_all_pdfs(directory, password=password)
+        statements = parse_all_pdfs(directory, password=password, max_workers=None)
         typer.echo(f"Parsed {len(statements)} statements")
 
         if verbose:
@@ -367,14 +370,23 @@ def unlock(
         typer.echo("Install with: uv sync", err=True)
         raise typer.Exit(1)
 
-    # Find all PDFs
-    pdf_files = list(directory.glob("*.pdf")) + list(directory.glob("*.PDF"))
+    # Find all PDFs in one directory pass, matching .pdf case-insensitively
+    with os.scandir(directory) as entries:
+        pdf_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".pdf") and entry.is_file()
+        )
     if not pdf_files:
         typer.echo(f"No PDF files found in {directory}", err=True)
         raise typer.Exit(1)
 
-    # Filter to only encrypted PDFs
-    encrypted_pdfs = [p for p in pdf_files if is_pdf_encrypted(p)]
+    # Filter to only encrypted PDFs (checks are I/O-bound, so use threads)
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as pool:
+        encrypted_flags = list(pool.map(is_pdf_encrypted, pdf_files))
+    encrypted_pdfs = [p for p, encrypted in zip(pdf_files, encrypted_flags) if encrypted]
     if not encrypted_pdfs:
         typer.echo("No encrypted PDFs found - all files are already unlocked")
         raise typer.Exit(0)
@@ -410,8 +422,11 @@ def unlock(
         typer.echo("Unlocking PDFs...")
         successful, failed = unlock_pdfs(encrypted_pdfs, output, pwd)
     else:
-        successful: list[Path] = []
-        failed: list[tuple[Path, str]] = []
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from thanakan_mail import unlock_pdf
+
+        unlocked_paths: dict[Path, Path] = {}
+        errors: dict[Path, str] = {}
 
         with Progress(
             SpinnerColumn(),
@@ -422,23 +437,31 @@ def unlock(
         ) as progress:
             task = progress.add_task("Unlocking PDFs...", total=len(encrypted_pdfs))
 
-            for pdf_path in encrypted_pdfs:
-                progress.update(task, description=f"Unlocking {pdf_path.name}")
-                try:
-                    from thanakan_mail import unlock_pdf
-
-                    if output:
-                        out_path = output / f"{pdf_path.stem}_unlocked{pdf_path.suffix}"
-                    else:
-                        out_path = None
-
-                    unlocked = unlock_pdf(pdf_path, out_path, pwd)
-                    successful.append(unlocked)
-                except Exception as e:
-                    error_msg = "Incorrect password" if "password" in str(e).lower() else str(e)
-                    failed.append((pdf_path, error_msg))
-
-                progress.advance(task)
+            # Unlock on worker threads (pikepdf does the work in C++, and the
+            # rewrite is I/O); advance the bar as each file finishes
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                futures = {
+                    pool.submit(
+                        unlock_pdf,
+                        pdf_path,
+                        output / f"{pdf_path.stem}_unlocked{pdf_path.suffix}" if output else None,
+                        pwd,
+                    ): pdf_path
+                    for pdf_path in encrypted_pdfs
+                }
+                for future in as_completed(futures):
+                    pdf_path = futures[future]
+                    progress.update(task, description=f"Unlocked {pdf_path.name}")
+                    try:
+                        unlocked_paths[pdf_path] = future.result()
+                    except Exception as e:
+                        errors[pdf_path] = "Incorrect password" if "password" in str(e).lower() else str(e)
+
+                    progress.advance(task)
+
+        # Report in directory order rather than completion order
+        successful = [unlocked_paths[p] for p in encrypted_pdfs if p in unlocked_paths]
+        failed = [(p, errors[p]) for p in encrypted_pdfs if p in errors]
 
     # Report results
     if successful:
@@ -1,13 +1,19 @@
 """Thanakan CLI - Thai bank PDF statement parser commands"""
 
-import json
+import stat
 import sys
+from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from thanakan.cli_enums import Language
+
 statement_app = typer.Typer(
     name="statement",
     help="Parse Thai bank PDF statements (KBank, BBL)",
@@ -23,13 +29,6 @@ class OutputFormat(str, Enum):
     excel = "excel"
 
 
-class Language(str, Enum):
-    """Preferred language for statement selection."""
-
-    en = "en"
-    th = "th"
-
-
 @statement_app.command()
 def parse(
     path: Path = typer.Argument(
@@ -45,6 +44,18 @@ def parse(
         help="PDF password (default: env PDF_PASS)",
         envvar="PDF_PASS",
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes for parsing a directory (default: CPU count; serial under 4 PDFs)",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse parsed statements from the on-disk cache (stores decrypted data)",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -57,32 +68,38 @@ def parse(
     Accepts a single PDF file or a directory of PDFs.
     Auto-detects bank type (KBank, BBL) and language (Thai/English).
     """
-    try:
-        from thanakan_statement import parse_all_pdfs, parse_pdf
-    except ImportError as e:
-        typer.echo(f"Error: Missing dependency - {e}", err=True)
-        typer.echo("Install with: uv sync", err=True)
-        raise typer.Exit(1)
+    stm = _load_statement_module()
 
     pwd = password
+    cache_dir = stm.cache.DEFAULT_CACHE_DIR if cache else None
 
     try:
-        if path.is_file():
+        # One stat call for both the file and directory checks
+        mode = path.stat().st_mode
+        if stat.S_ISREG(mode):
             if verbose:
                 typer.echo(f"Parsing: {path}", err=True)
-            statement = parse_pdf(path, password=pwd)
-            print(statement.model_dump_json(indent=2))
+            statement = stm.parse_pdf(path, password=pwd, cache_dir=cache_dir)
+            # Write the serializer's bytes directly, skipping the str round-trip
+            sys.stdout.buffer.write(
+                statement.__pydantic_serializer__.to_json(statement, indent=2, exclude_none=True)
+            )
+            sys.stdout.buffer.write(b"\n")
             if verbose:
                 _print_parse_summary([statement])
-        elif path.is_dir():
+        elif stat.S_ISDIR(mode):
             if verbose:
                 typer.echo(f"Scanning directory: {path}", err=True)
-            statements = parse_all_pdfs(path, password=pwd)
+            statements = stm.parse_all_pdfs(
+                path, password=pwd, max_workers=jobs, cache_dir=cache_dir
+            )
             if not statements:
                 typer.echo("No PDFs found or parsed", err=True)
                 raise typer.Exit(1)
-            output = [s.model_dump(mode="json") for s in statements]
-            print(json.dumps(output, indent=2, default=str))
+            sys.stdout.buffer.write(
+                _list_adapter(stm.Statement).dump_json(statements, indent=2, exclude_none=True)
+            )
+            sys.stdout.buffer.write(b"\n")
             if verbose:
                 _print_parse_summary(statements)
         else:
@@ -124,6 +141,21 @@ def export_cmd(
         "-l",
         help="Preferred language for overlapping statements",
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help=(
+            "Worker processes for parsing and writing CSVs "
+            "(default: CPU count; serial under 4 PDFs)"
+        ),
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse parsed statements from the on-disk cache (stores decrypted data)",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -136,27 +168,19 @@ def export_cmd(
     Full pipeline: parse -> consolidate -> deduplicate -> export.
     For CSV format, output path should be a directory (one file per account).
     """
-    try:
-        from thanakan_statement import (
-            consolidate_by_account,
-            export_to_csv,
-            export_to_excel,
-            export_to_json,
-            parse_all_pdfs,
-            parse_pdf,
-        )
-    except ImportError as e:
-        typer.echo(f"Error: Missing dependency - {e}", err=True)
-        raise typer.Exit(1)
+    stm = _load_statement_module()
 
     pwd = password
+    cache_dir = stm.cache.DEFAULT_CACHE_DIR if cache else None
 
     # Parse PDFs
     try:
         if path.is_file():
-            statements = [parse_pdf(path, password=pwd)]
+            statements = [stm.parse_pdf(path, password=pwd, cache_dir=cache_dir)]
         else:
-            statements = parse_all_pdfs(path, password=pwd)
+            statements = stm.parse_all_pdfs(
+                path, password=pwd, max_workers=jobs, cache_dir=cache_dir
+            )
 
         if not statements:
             typer.echo("No PDFs found or parsed", err=True)
@@ -169,7 +193,7 @@ def export_cmd(
         raise typer.Exit(1)
 
     # Consolidate
-    accounts = consolidate_by_account(statements, preferred_language=language.value)
+    accounts = stm.consolidate_by_account(statements, preferred_language=language.value)
     if verbose:
         typer.echo(f"Consolidated into {len(accounts)} account(s)", err=True)
         for acc in accounts:
@@ -181,13 +205,13 @@ def export_cmd(
     # Export
     try:
         if format == OutputFormat.json:
-            export_to_json(accounts, output)
+            stm.export_to_json(accounts, output)
             typer.echo(f"Exported to {output}", err=True)
         elif format == OutputFormat.csv:
-            export_to_csv(accounts, output)
+            stm.export_to_csv(accounts, output, max_workers=jobs)
             typer.echo(f"Exported CSVs to {output}/", err=True)
         elif format == OutputFormat.excel:
-            export_to_excel(accounts, output)
+            stm.export_to_excel(accounts, output)
             typer.echo(f"Exported to {output}", err=True)
     except Exception as e:
         typer.echo(f"Error exporting: {e}", err=True)
@@ -209,27 +233,37 @@ def validate(
         help="PDF password (default: env PDF_PASS)",
         envvar="PDF_PASS",
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes for parsing a directory (default: CPU count; serial under 4 PDFs)",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse parsed statements from the on-disk cache (stores decrypted data)",
+    ),
 ):
     """Validate balance continuity across statements.
 
     Checks that closing balance of each statement matches
     opening balance of the next consecutive statement.
     """
-    try:
-        from thanakan_statement import parse_all_pdfs, parse_pdf, validate_balance_continuity
-        from thanakan_statement.consolidate import group_statements_by_account
-    except ImportError as e:
-        typer.echo(f"Error: Missing dependency - {e}", err=True)
-        raise typer.Exit(1)
+    stm = _load_statement_module()
 
     pwd = password
+    cache_dir = stm.cache.DEFAULT_CACHE_DIR if cache else None
 
     # Parse PDFs
     try:
         if path.is_file():
-            statements = [parse_pdf(path, password=pwd)]
+            statements = [stm.parse_pdf(path, password=pwd, cache_dir=cache_dir)]
         else:
-            statements = parse_all_pdfs(path, password=pwd)
+            statements = stm.parse_all_pdfs(
+                path, password=pwd, max_workers=jobs, cache_dir=cache_dir
+            )
 
         if not statements:
             typer.echo("No PDFs found or parsed", err=True)
@@ -239,14 +273,14 @@ def validate(
         raise typer.Exit(1)
 
     # Group by account and validate each
-    groups = group_statements_by_account(statements)
+    groups = stm.consolidate.group_statements_by_account(statements)
     all_valid = True
 
     for account_number, account_statements in sorted(groups.items()):
-        # Sort by period start
-        account_statements.sort(key=lambda s: s.statement_period_start)
+        # Sort by period start (a single linear pass when already in order)
+        account_statements.sort(key=attrgetter("statement_period_start"))
 
-        is_valid, issues = validate_balance_continuity(account_statements)
+        is_valid, issues = stm.validate_balance_continuity(account_statements)
 
         if is_valid:
             typer.echo(
@@ -257,13 +291,15 @@ def validate(
             typer.echo(
                 f"[FAIL] {account_number}: {len(issues)} issue(s) found", err=True
             )
-            for issue in issues:
-                typer.echo(
+            typer.echo(
+                "\n".join(
                     f"  - {issue.statement.source_pdf}: "
                     f"expected opening {issue.expected_opening}, "
-                    f"got {issue.actual_opening}",
-                    err=True,
-                )
+                    f"got {issue.actual_opening}"
+                    for issue in issues
+                ),
+                err=True,
+            )
 
     if not all_valid:
         raise typer.Exit(1)
@@ -317,15 +353,10 @@ def kshop(
 
         thanakan stm kshop --since 3m -v
     """
-    try:
-        from thanakan_mail import fetch_kshop_summaries, save_kshop_json
-    except ImportError as e:
-        typer.echo(f"Error: Missing dependency - {e}", err=True)
-        typer.echo("Install with: uv sync", err=True)
-        raise typer.Exit(1)
+    mail = _load_mail_module()
 
     try:
-        summaries = fetch_kshop_summaries(
+        summaries = mail.fetch_kshop_summaries(
             max_emails=max_emails,
             since=since,
             until=until,
@@ -344,53 +375,42 @@ def kshop(
         raise typer.Exit(1)
 
     if output:
-        save_kshop_json(summaries, output)
+        mail.save_kshop_json(summaries, output)
         typer.echo(f"Exported {len(summaries)} summaries to {output}", err=True)
 
     # When piped, output JSON for machine consumption
     if not sys.stdout.isatty():
-        data = [s.model_dump(mode="json") for s in summaries]
-        print(json.dumps(data, default=str, ensure_ascii=False))
+        sys.stdout.buffer.write(_list_adapter(mail.KShopSummary).dump_json(summaries))
+        sys.stdout.buffer.write(b"\n")
         return
 
-    # Display tables grouped by store
-    from collections import defaultdict
-    from decimal import Decimal
-    from email.utils import parsedate_to_datetime
-
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-
-    console = Console()
+    # Display tables grouped by store; rich is slow to import, so only
+    # this branch pays for it
+    from rich.console import Console, Group
 
-    # Group by store_id
-    by_store: dict[str, list] = defaultdict(list)
-    for s in summaries:
-        by_store[s.store_id].append(s)
+    # Cells are plain dates and amounts; skip Rich's per-cell regex highlighter
+    console = Console(highlight=False)
 
-    def _parse_date(email_date: str) -> str:
-        try:
-            return parsedate_to_datetime(email_date).strftime("%Y-%m-%d")
-        except Exception:
-            return email_date
+    # Pair each summary with its date, parsed once for both sorting and
+    # display, and order the rows by store_id then newest date first (the
+    # second sort is stable, so dates stay descending within a store)
+    rows = [(_parse_date(s.email_date), s) for s in summaries]
+    rows.sort(key=itemgetter(0), reverse=True)
+    rows.sort(key=lambda row: row[1].store_id)
 
     grand_total = Decimal(0)
     grand_days = 0
-
-    for store_id, store_summaries in sorted(by_store.items()):
-        store_name = store_summaries[0].store_name
-        account = store_summaries[0].account_number
-        account_name = store_summaries[0].account_name
-
-        # Sort by date descending (newest first)
-        store_summaries.sort(
-            key=lambda s: _parse_date(s.email_date), reverse=True
-        )
-
-        store_total = sum(s.daily_amount for s in store_summaries)
-        grand_total += store_total
-        grand_days += len(store_summaries)
+    store_count = 0
+    # Tables, each followed by a blank line, printed in one call at the end
+    renderables: list = []
+
+    for store_id, group in groupby(rows, key=lambda row: row[1].store_id):
+        store_rows = list(group)
+        store_count += 1
+        first = store_rows[0][1]
+        store_name = first.store_name
+        account = first.account_number
+        account_name = first.account_name
 
         # Store header
         header = f"{store_name}  [dim]{store_id}[/dim]"
@@ -399,39 +419,100 @@ def kshop(
         else:
             header += f"\n{account}"
 
-        # Date-Amount table
-        table = Table(
-            show_header=True,
-            title=header,
-            title_style="bold green",
-            title_justify="left",
-        )
-        table.add_column("Date", style="cyan")
-        table.add_column("Amount (THB)", justify="right", style="bold")
+        table = _make_store_table(header)
 
-        for s in store_summaries:
-            table.add_row(_parse_date(s.email_date), f"{s.daily_amount:,.2f}")
+        # Total the store while adding its rows
+        store_total = Decimal(0)
+        for date, s in store_rows:
+            store_total += s.daily_amount
+            table.add_row(date, f"{s.daily_amount:,.2f}")
+        grand_total += store_total
+        grand_days += len(store_rows)
 
         table.add_section()
-        table.add_row(f"{len(store_summaries)} days", f"{store_total:,.2f}")
+        table.add_row(f"{len(store_rows)} days", f"{store_total:,.2f}")
 
-        console.print(table)
-        console.print()
+        renderables.extend((table, ""))
 
     # Grand total across all stores
-    if len(by_store) > 1:
-        console.print(
+    if store_count > 1:
+        renderables.append(
             f"[bold]Total: {grand_days} days, {grand_total:,.2f} THB[/bold]"
         )
 
+    console.print(Group(*renderables))
+
+
+def _load_statement_module():
+    """Import thanakan_statement, exiting with an install hint if it is missing."""
+    try:
+        import thanakan_statement
+        import thanakan_statement.cache  # noqa: F401
+        import thanakan_statement.consolidate  # noqa: F401
+    except ImportError as e:
+        _exit_missing_dependency(e)
+    return thanakan_statement
+
+
+def _load_mail_module():
+    """Import thanakan_mail, exiting with an install hint if it is missing."""
+    try:
+        import thanakan_mail
+    except ImportError as e:
+        _exit_missing_dependency(e)
+    return thanakan_mail
+
+
+def _exit_missing_dependency(error: ImportError):
+    """Report a missing package and exit."""
+    typer.echo(f"Error: Missing dependency - {error}", err=True)
+    typer.echo("Install with: uv sync", err=True)
+    raise typer.Exit(1)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model):
+    """Return a TypeAdapter for list[model], built on first use and reused."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(list[model])
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(email_date: str) -> str:
+    """Format an email Date header as YYYY-MM-DD (unchanged if unparsable)."""
+    # email.utils is slow to import; only the kshop table needs it
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return parsedate_to_datetime(email_date).strftime("%Y-%m-%d")
+    except Exception:
+        return email_date
+
+
+def _make_store_table(header: str):
+    """Create an empty Date/Amount table for one KShop store."""
+    from rich.table import Table
+
+    table = Table(
+        show_header=True,
+        title=header,
+        title_style="bold green",
+        title_justify="left",
+    )
+    table.add_column("Date", style="cyan")
+    table.add_column("Amount (THB)", justify="right", style="bold")
+    return table
+
 
 def _print_parse_summary(statements):
     """Print parsing summary to stderr."""
-    typer.echo("\n--- Summary ---", err=True)
-    for stmt in statements:
-        typer.echo(
-            f"  {stmt.account_number} ({stmt.bank}/{stmt.language}): "
-            f"{len(stmt.transactions)} transactions, "
-            f"{stmt.statement_period_start} to {stmt.statement_period_end}",
-            err=True,
-        )
+    lines = ["\n--- Summary ---"]
+    lines.extend(
+        f"  {stmt.account_number} ({stmt.bank}/{stmt.language}): "
+        f"{len(stmt.transactions)} transactions, "
+        f"{stmt.statement_period_start} to {stmt.statement_period_end}"
+        for stmt in statements
+    )
+    # One write to stderr instead of one per statement
+    typer.echo("\n".join(lines), err=True)